@@ -0,0 +1,21 @@
+"""
+Sliding puzzle (8-puzzle, 15-puzzle, ...) solver.
+
+Importing the package only loads the solver; the Tk GUI lives in
+eightpuzzle.gui and is imported on demand, and SolutionStore (with
+sqlite3) is loaded on first access.
+"""
+
+from .cache import SolutionCache
+from .heuristics import Heuristic, register_heuristic, get_heuristic
+from .solver import (PuzzleNode, calculate_heuristic, calculate_manhattan_distance,
+                     calculate_linear_conflict_distance, is_solvable, parse_board,
+                     get_neighbors, get_packed_neighbors, reconstruct_path,
+                     find_solution, solve_puzzle, solve_many, HEURISTICS)
+
+
+def __getattr__(name):
+    if name == "SolutionStore":
+        from .store import SolutionStore
+        return SolutionStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,254 @@
+"""
+Benchmark harness with fixed instance sets.
+
+Each run solves every board of an instance set with one solver method and
+heuristic and records nodes expanded, nodes/sec, wall time and peak memory.
+Every configuration runs in a fresh process, so its peak resident set size
+(ru_maxrss) is its own; --trace-memory adds the peak of Python allocations
+traced by tracemalloc. Results are written as JSON so runs can be compared
+over time.
+
+Instance sets:
+  3x3-depths  random solvable 3x3 boards at every optimal depth 0-31,
+              drawn with a fixed seed from the 3x3 lookup table
+  4x4-walks   4x4 boards from fixed-seed random walks off the goal. These
+              are NOT Korf's 100 and are much easier; don't compare them
+              with published Korf's 100 results.
+  korf100     Korf's 100 15-puzzle instances, read from a file given with
+              --korf100 (one board per line, 16 numbers, blank = 0,
+              goal 0,1,...,15). They are not bundled here.
+"""
+
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from .heuristics import get_heuristic
+from .lookup import get_table, UNREACHABLE
+from .moves import adjacency_table
+from .ranking import unrank
+from .solver import HEURISTICS, METHODS, default_goal, find_solution
+
+KORF_GOAL = tuple(range(16))
+
+SET_DESCRIPTIONS = {
+    "3x3-depths": "random solvable 3x3 boards at each optimal depth, fixed seed",
+    "4x4-walks": "fixed-seed random walks off the 4x4 goal; not Korf's 100 and much easier",
+    "korf100": "Korf's 100 15-puzzle instances, read from --korf100",
+}
+
+
+def depth_instances(goal_state, per_depth=5, seed=0, width=3):
+    """Returns (depth, board) pairs: up to `per_depth` boards per optimal depth."""
+    table = get_table(goal_state, width)
+    by_depth = {}
+    for index, entry in enumerate(table):
+        if entry != UNREACHABLE:
+            by_depth.setdefault(entry >> 2, []).append(index)
+
+    rng = random.Random(seed)
+    instances = []
+    for depth in sorted(by_depth):
+        indices = by_depth[depth]
+        for index in sorted(rng.sample(indices, min(per_depth, len(indices)))):
+            instances.append((depth, unrank(index, len(goal_state))))
+    return instances
+
+
+def walk_instances(goal_state, count=10, length=60, seed=0, width=4):
+    """Returns (None, board) pairs from fixed-seed random walks off the goal."""
+    rng = random.Random(seed)
+    adjacent = adjacency_table(width, len(goal_state) // width)
+    instances = []
+    for _ in range(count):
+        state = list(goal_state)
+        previous = -1
+        for _ in range(length):
+            blank_index = state.index(0)
+            swap_index = rng.choice([i for i in adjacent[blank_index] if i != previous])
+            state[blank_index], state[swap_index] = state[swap_index], state[blank_index]
+            previous = blank_index
+        instances.append((None, tuple(state)))
+    return instances
+
+
+def load_instances(path):
+    """Reads one board per line (numbers separated by spaces or commas)."""
+    instances = []
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0].replace(",", " ").split()
+            if line:
+                instances.append((None, tuple(int(tile) for tile in line)))
+    return instances
+
+
+def instance_sets(args):
+    """Builds the instance sets selected on the command line."""
+    sets = {}
+    if "3x3-depths" in args.sets:
+        sets["3x3-depths"] = (default_goal(9), 3,
+                              depth_instances(default_goal(9), args.per_depth, args.seed))
+    if "4x4-walks" in args.sets:
+        sets["4x4-walks"] = (default_goal(16), 4,
+                             walk_instances(default_goal(16), args.walks, args.walk_length, args.seed))
+    if "korf100" in args.sets:
+        if not args.korf100:
+            raise SystemExit("the korf100 set needs --korf100 FILE")
+        sets["korf100"] = (KORF_GOAL, 4, load_instances(args.korf100))
+    return sets
+
+
+def peak_rss():
+    """Peak resident set size of this process in bytes, or None where unavailable."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # KiB except on macOS
+
+
+def run_config(goal_state, width, instances, method, heuristic, trace_memory=False):
+    """
+    Solves every instance with one configuration and returns its summary.
+    peak_memory_bytes is the process's peak RSS so far, so run_isolated()
+    gives each configuration a fresh process.
+    """
+    records = []
+    total_nodes = 0
+    peak_traced = 0
+    start_time = time.perf_counter()
+
+    for depth, board in instances:
+        if trace_memory:
+            tracemalloc.start()
+        solve_start = time.perf_counter()
+        solution_info = find_solution(board, goal_state, method=method,
+                                      heuristic=heuristic, width=width)
+        elapsed = time.perf_counter() - solve_start
+        if trace_memory:
+            peak_traced = max(peak_traced, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        nodes = solution_info.get("explored", 0) if solution_info else 0
+        total_nodes += nodes
+        records.append({
+            "board": ",".join(map(str, board)),
+            "depth": depth,
+            "moves": solution_info.get("moves") if solution_info else None,
+            "nodes": nodes,
+            "time": elapsed,
+        })
+
+    wall_time = time.perf_counter() - start_time
+    return {
+        "method": method,
+        "heuristic": heuristic,
+        "instances": len(instances),
+        "nodes": total_nodes,
+        "nodes_per_sec": total_nodes / wall_time if wall_time > 0 else 0.0,
+        "wall_time": wall_time,
+        "peak_memory_bytes": peak_rss(),
+        "peak_traced_bytes": peak_traced if trace_memory else None,
+        "results": records,
+    }
+
+
+def _run_child(connection, goal_state, width, instances, method, heuristic, trace_memory):
+    with connection:
+        # Load the tables before timing, as run() does for in-process runs
+        if method == "table":
+            get_table(goal_state, width)
+        get_heuristic(heuristic, goal_state, width)
+        connection.send(run_config(goal_state, width, instances, method, heuristic,
+                                   trace_memory))
+
+
+def run_isolated(goal_state, width, instances, method, heuristic, trace_memory=False):
+    """run_config() in a fresh spawned process, so its peak memory is its own."""
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_run_child, args=(
+        sender, goal_state, width, instances, method, heuristic, trace_memory))
+    process.start()
+    sender.close()
+    with receiver:
+        try:
+            summary = receiver.recv()
+        except EOFError:
+            summary = None
+    process.join()
+    if summary is None:
+        raise RuntimeError(f"benchmark process for {method}/{heuristic} "
+                           f"exited with code {process.exitcode}")
+    return summary
+
+
+def supported(method, heuristic, goal_state):
+    """Skips combinations a solver can't run."""
+    if method == "table":
+        return heuristic == "manhattan" and len(goal_state) <= 9
+    if method == "bidirectional":
+        return heuristic in ("manhattan", "linear_conflict", "walking_distance")
+    return True
+
+
+def run(args):
+    """The `bench` subcommand."""
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sets": {},
+        "runs": [],
+    }
+    for set_name, (goal_state, width, instances) in instance_sets(args).items():
+        report["sets"][set_name] = {"description": SET_DESCRIPTIONS[set_name],
+                                    "instances": len(instances)}
+        # Build and save any tables up front, so each run only loads them
+        for heuristic in args.heuristics:
+            get_heuristic(heuristic, goal_state, width)
+
+        for method in args.methods:
+            for heuristic in args.heuristics:
+                if not supported(method, heuristic, goal_state):
+                    continue
+                summary = run_isolated(goal_state, width, instances, method, heuristic,
+                                       args.trace_memory)
+                summary["set"] = set_name
+                report["runs"].append(summary)
+                memory = ""
+                if summary["peak_memory_bytes"] is not None:
+                    memory += f", peak RSS {summary['peak_memory_bytes'] / 2**20:.0f} MiB"
+                if args.trace_memory:
+                    memory += f", traced {summary['peak_traced_bytes'] / 1024:.0f} KiB"
+                print(f"{set_name:12} {method:14} {heuristic:16} "
+                      f"{summary['nodes']:>10} nodes {summary['wall_time']:8.2f}s "
+                      f"{summary['nodes_per_sec']:>10.0f} nodes/s{memory}", file=sys.stderr)
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=1)
+    print(f"Results written to {args.output}", file=sys.stderr)
+    return 0
+
+
+def add_arguments(parser):
+    """Adds the `bench` options to an argparse parser."""
+    parser.add_argument("--sets", nargs="+", default=["3x3-depths"],
+                        choices=["3x3-depths", "4x4-walks", "korf100"])
+    parser.add_argument("--methods", nargs="+", default=["astar"], choices=METHODS)
+    parser.add_argument("--heuristics", nargs="+", default=["manhattan"],
+                        choices=sorted(HEURISTICS))
+    parser.add_argument("--per-depth", type=int, default=5, help="3x3 boards per depth")
+    parser.add_argument("--walks", type=int, default=10, help="number of 4x4 walk boards")
+    parser.add_argument("--walk-length", type=int, default=60, help="moves per 4x4 walk")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--korf100", metavar="FILE", help="file with Korf's 100 instances")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="record peak memory with tracemalloc (slows solving)")
+    parser.add_argument("-o", "--output", default="bench.json", help="JSON results file")
@@ -0,0 +1,153 @@
+"""
+Bidirectional A*.
+
+One search runs forward from the start toward the goal and another runs
+backward from the goal toward the start, each with its own heuristic (the
+distance to the other end). Both work on packed states and share a single
+hash table: each state maps to its g-cost and parent in each direction.
+
+Open lists are ordered by the meet-in-the-middle priority max(f, 2g)
+rather than by f, so neither direction expands a node more than halfway
+to the other end. A state may then be reached again by a cheaper path
+after it was expanded, so states are reopened rather than closed.
+
+Every time one direction generates a state the other has already reached,
+the path through it is a candidate. Search stops when the best candidate
+is no longer than the larger of two lower bounds on any path not yet
+found: the smaller priority at the front of the two open lists, and the
+smallest g in each open list plus one (such a path must join an open node
+of each direction by at least one move).
+
+This is not a faster A*. It expands about 10% fewer nodes than A* on
+hard 3x3 boards with Manhattan distance, but with linear conflict, and on
+4x4 boards, it expands 15-20% more, so A* stays the default.
+"""
+
+import time
+
+from .heuristics import HEURISTICS, get_heuristic
+from .limits import SearchLimits
+from .moves import move_table
+from .openlist import BucketQueue
+from .packing import pack_state, unpack_state, move_blank, get_tile, cell_bits
+
+INFINITY = float("inf")
+FORWARD, BACKWARD = 0, 1
+
+
+def bidirectional_astar(initial_state, goal_state, width=3, heuristic="manhattan",
+                        limits=None):
+    """
+    Solves a board with bidirectional A*. The backward search needs the
+    heuristic compiled toward the start state, so only heuristics that are
+    cheap to compile for any target (Manhattan, linear conflict, walking
+    distance) are supported. Returns the same solution_info dict shape as the A* solver.
+    """
+    initial_state, goal_state = tuple(initial_state), tuple(goal_state)
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"unknown heuristic {heuristic!r}")
+    forward = get_heuristic(heuristic, goal_state, width)
+    if not forward.cheap_to_compile:
+        raise ValueError(f"bidirectional search does not support heuristic {heuristic!r}")
+
+    limits = limits or SearchLimits()
+    size = len(goal_state)
+    bits = cell_bits(size)
+    moves = move_table(width, size // width)
+    start_time = time.time()
+
+    # Per direction: the heuristic toward the state it heads for
+    scorers = (forward, get_heuristic(heuristic, initial_state, width))
+    needs_board = forward.needs_board
+
+    def full_h(state, direction):
+        return scorers[direction].h(state)
+
+    start, goal = pack_state(initial_state, bits), pack_state(goal_state, bits)
+    # state -> [g forward, g backward, parent forward, parent backward]
+    table = {start: [0, INFINITY, None, None]}
+    table.setdefault(goal, [INFINITY, INFINITY, None, None])[BACKWARD] = 0
+    open_lists = (BucketQueue(), BucketQueue())
+    start_h, goal_h = full_h(initial_state, FORWARD), full_h(goal_state, BACKWARD)
+    open_lists[FORWARD].push((start, initial_state.index(0), 0, start_h), start_h, 0)
+    open_lists[BACKWARD].push((goal, goal_state.index(0), 0, goal_h), goal_h, 0)
+    # Open entries per g-cost in each direction, and the smallest such g
+    g_counts = ([1], [1])
+    g_mins = [0, 0]
+
+    best_cost = 0 if start == goal else INFINITY
+    meeting = start if start == goal else None
+    explored = 0
+
+    while open_lists[FORWARD] and open_lists[BACKWARD]:
+        for d in (FORWARD, BACKWARD):
+            counts = g_counts[d]
+            while not counts[g_mins[d]]:
+                g_mins[d] += 1
+        pf, pb = open_lists[FORWARD].peek_f(), open_lists[BACKWARD].peek_f()
+        bound = max(min(pf, pb), g_mins[FORWARD] + g_mins[BACKWARD] + 1)
+        if best_cost <= bound:
+            break
+        if explored >= limits.check_at and limits.check(
+                explored, len(open_lists[FORWARD]) + len(open_lists[BACKWARD]), bound):
+            return limits.result(start_time, explored, bound)
+
+        # Expand the lower priority; on a tie, the smaller frontier
+        sizes = len(open_lists[FORWARD]), len(open_lists[BACKWARD])
+        direction = FORWARD if (pf, sizes[0]) <= (pb, sizes[1]) else BACKWARD
+        other = 1 - direction
+        state, blank_index, g_cost, h_cost = open_lists[direction].pop()
+        g_counts[direction][g_cost] -= 1
+        if g_cost > table[state][direction]:
+            continue  # Stale open-list entry
+        explored += 1
+
+        child_h_cost = scorers[direction].delta
+        board = unpack_state(state, size, bits) if needs_board else None
+
+        for swap_index, _ in moves[blank_index]:
+            child = move_blank(state, blank_index, swap_index, bits)
+            child_g = g_cost + 1
+            child_entry = table.get(child)
+            if child_entry is None:
+                child_entry = table[child] = [INFINITY, INFINITY, None, None]
+            elif child_g >= child_entry[direction]:
+                continue
+            child_entry[direction] = child_g
+            child_entry[direction + 2] = state
+
+            tile = get_tile(state, swap_index, bits)
+            child_h = child_h_cost(h_cost, board, tile, blank_index, swap_index)
+            open_lists[direction].push((child, swap_index, child_g, child_h),
+                                       max(child_g + child_h, 2 * child_g), child_g)
+            counts = g_counts[direction]
+            if len(counts) <= child_g:
+                counts.append(0)
+            counts[child_g] += 1
+
+            if child_g + child_entry[other] < best_cost:
+                best_cost = child_g + child_entry[other]
+                meeting = child
+
+    if meeting is None:
+        return None
+
+    # Walk from the meeting state back to the start, then on to the goal
+    path = []
+    state = meeting
+    while state is not None:
+        path.append(state)
+        state = table[state][FORWARD + 2]
+    path.reverse()
+    state = table[meeting][BACKWARD + 2]
+    while state is not None:
+        path.append(state)
+        state = table[state][BACKWARD + 2]
+
+    return {
+        "unsolvable": False,
+        "path": [unpack_state(state, size, bits) for state in path],
+        "time": time.time() - start_time,
+        "moves": len(path) - 1,
+        "explored": explored
+    }
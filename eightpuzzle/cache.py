@@ -0,0 +1,80 @@
+"""
+In-memory LRU cache of solved boards.
+
+Every suffix of an optimal path is an optimal path from its first state,
+so storing one solution indexes every state along it: each state maps to
+the shared tuple of packed path states and its position in it. Entries
+are keyed by (packed state, goal, width) and the least recently used are
+evicted once more than `maxsize` states are indexed.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from .moves import board_width
+from .packing import pack_state, unpack_state, cell_bits
+
+DEFAULT_CACHE_SIZE = 100_000  # Indexed states
+
+
+class SolutionCache:
+    """LRU map from (board, goal) to an optimal solution path."""
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._entries = OrderedDict()  # key -> (packed path, index into it)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _key(self, packed, goal_state, width):
+        return packed, goal_state, width or board_width(len(goal_state))
+
+    def lookup(self, state, goal_state, width=None):
+        """Returns a solution_info dict for a cached board, else None."""
+        start_time = time.time()
+        goal_state = tuple(goal_state)
+        bits = cell_bits(len(goal_state))
+        key = self._key(pack_state(state, bits), goal_state, width)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        path, index = entry
+        return {
+            "unsolvable": False,
+            "path": [unpack_state(packed, len(goal_state), bits) for packed in path[index:]],
+            "time": time.time() - start_time,
+            "moves": len(path) - 1 - index,
+            "explored": 0,
+            "cached": True,
+        }
+
+    def store(self, solution_info, goal_state, width=None):
+        """Indexes every state on a solved path; other results are ignored."""
+        if not solution_info or solution_info.get("unsolvable") or "path" not in solution_info:
+            return
+        if self.maxsize <= 0:
+            return
+        goal_state = tuple(goal_state)
+        bits = cell_bits(len(goal_state))
+        path = tuple(pack_state(state, bits) for state in solution_info["path"])
+        with self._lock:
+            # Goal end first, so the start state is the most recently used
+            for index in range(len(path) - 1, -1, -1):
+                key = self._key(path[index], goal_state, width)
+                self._entries[key] = (path, index)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
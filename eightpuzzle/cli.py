@@ -0,0 +1,253 @@
+"""
+Command-line entry point: opens the GUI by default, or solves boards in
+batch with the `solve` subcommand without ever importing tkinter. The
+`store` subcommand imports and exports SQLite solution stores as JSONL.
+"""
+
+import argparse
+import collections
+import itertools
+import json
+import sys
+import time
+
+from . import bench
+from .lookup import MAX_TABLE_CELLS
+from .moves import board_width, moves_from_path
+from .solver import (HEURISTICS, METHODS, check_boards, default_goal, parse_board,
+                     solve_many, warm_up)
+
+
+# 0 represents the blank space
+
+# --- THIS IS A SOLVABLE PUZZLE ---
+INITIAL_STATE = (1, 2, 3,
+                 7, 4, 5,
+                 0, 8, 6)
+
+# The classic goal state (0 inversions)
+GOAL_STATE = (1, 2, 3,
+              4, 5, 6,
+              7, 8, 0)
+
+def _open(parser, path, mode="r"):
+    """Opens a file named on the command line ("-" is stdin/stdout), or exits with a usage error."""
+    if path == "-":
+        return sys.stdout if "w" in mode else sys.stdin
+    try:
+        return open(path, mode)
+    except OSError as error:
+        parser.error(f"can't open {path}: {error.strerror}")
+
+def _parse_goal(parser, text):
+    """Parses --goal, or exits with a usage error."""
+    try:
+        return parse_board(text) if text else None
+    except ValueError as error:
+        parser.error(f"--goal: {error}")
+
+def _read_boards(infile, size=None):
+    """
+    Yields (line number, board, error) for each non-blank input line, with
+    board None and an error message for lines that aren't valid boards.
+    Without `size`, the first valid board sets it.
+    """
+    for line_number, line in enumerate(infile, 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        try:
+            board = parse_board(line, size)
+        except ValueError as error:
+            yield line_number, None, str(error)
+            continue
+        size = len(board)
+        yield line_number, board, None
+
+def _record(line_number, board, solution_info, width):
+    """The JSONL output record for one solved (or not) board."""
+    record = {"line": line_number, "board": list(board)}
+    if solution_info is None or solution_info["unsolvable"]:
+        record["unsolvable"] = True
+    elif solution_info.get("stopped"):
+        record.update({
+            "unsolvable": False,
+            "stopped": solution_info["stopped"],
+            "bound": solution_info["bound"],
+            "explored": solution_info["explored"],
+            "time": round(solution_info["time"], 6),
+        })
+    else:
+        record.update({
+            "unsolvable": False,
+            "moves": solution_info["moves"],
+            "solution": "".join(name[0] for name in
+                                moves_from_path(solution_info["path"], width)),
+            "explored": solution_info["explored"],
+            "time": round(solution_info["time"], 6),
+        })
+    return record
+
+def run_batch(args, parser):
+    """
+    The `solve` subcommand: boards in (one per line), JSONL solutions out.
+    Input is read as the workers need it and records are written as
+    results arrive, so a long or endless input streams through.
+    """
+    if args.chunksize < 1:
+        parser.error("--chunksize must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    goal_state = _parse_goal(parser, args.goal)
+    infile = _open(parser, args.input)
+    outfile = _open(parser, args.output, "w")
+
+    # Entries read from the input but not written yet, in input order
+    pending = collections.deque()
+
+    def boards():
+        for entry in _read_boards(infile, len(goal_state) if goal_state else None):
+            pending.append(entry)
+            if entry[1] is not None:
+                yield entry[1]
+
+    board_stream = boards()
+    # Without --goal the first board decides the goal, so read up to it
+    first_board = next(board_stream, None)
+    if goal_state is None and first_board is not None:
+        goal_state = default_goal(len(first_board))
+
+    try:
+        width = args.width or (board_width(len(goal_state)) if goal_state else 3)
+        if goal_state:
+            check_boards(goal_state, goal_state, width)
+    except ValueError as error:
+        parser.error(f"{error} (see --width)")
+    if goal_state:
+        try:
+            # Also builds any tables once here rather than in every worker
+            warm_up(goal_state, width, args.method, args.heuristic)
+        except ValueError as error:
+            parser.error(str(error))
+    options = {"method": args.method, "heuristic": args.heuristic, "width": width,
+               "max_nodes": args.max_nodes, "max_time": args.max_time}
+    store = None
+    if args.store:
+        from .store import SolutionStore  # sqlite3 is only loaded when used
+        store = SolutionStore(args.store)
+    start_time = time.time()
+    results = iter(())
+    if first_board is not None:
+        results = solve_many(itertools.chain([first_board], board_stream), goal_state,
+                             workers=args.workers, chunksize=args.chunksize, store=store,
+                             **options)
+
+    counts = {"solved": 0, "unsolvable": 0, "stopped": 0, "invalid": 0}
+
+    def write_errors():
+        # Bad lines are written as soon as every board before them is
+        while pending and pending[0][1] is None:
+            line_number, _, error = pending.popleft()
+            outfile.write(json.dumps({"line": line_number, "error": error}) + "\n")
+            counts["invalid"] += 1
+
+    with infile, outfile:
+        for solution_info in results:
+            write_errors()
+            line_number, board, _ = pending.popleft()
+            record = _record(line_number, board, solution_info, width)
+            outfile.write(json.dumps(record) + "\n")
+            outfile.flush()
+            counts["stopped" if record.get("stopped") else
+                   "unsolvable" if record["unsolvable"] else "solved"] += 1
+        write_errors()
+    if store is not None:
+        store.close()
+
+    elapsed = time.time() - start_time
+    total = counts["solved"] + counts["unsolvable"] + counts["stopped"]
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"{total} boards in {elapsed:.2f}s ({rate:.1f} boards/s): "
+          f"{counts['solved']} solved, {counts['unsolvable']} unsolvable, "
+          f"{counts['stopped']} over budget, {counts['invalid']} invalid lines",
+          file=sys.stderr)
+    return 0
+
+def run_store(args, parser):
+    """The `store` subcommand: bulk export or import of a solution store as JSONL."""
+    import sqlite3
+    from .store import SolutionStore
+    goal_state = _parse_goal(parser, args.goal)
+    try:
+        store = SolutionStore(args.database)
+    except sqlite3.Error as error:
+        parser.error(f"can't open {args.database}: {error}")
+
+    with store:
+        if args.action == "export":
+            outfile = _open(parser, args.file, "w")
+            count = 0
+            with outfile:
+                for record in store.export_records():
+                    outfile.write(json.dumps(record) + "\n")
+                    count += 1
+            print(f"{count} solutions exported", file=sys.stderr)
+            return 0
+
+        infile = _open(parser, args.file)
+        with infile:
+            records = (json.loads(line) for line in infile if line.strip())
+            try:
+                count = store.import_records(records, goal_state, args.width)
+            except ValueError as error:
+                print(f"import failed, nothing was imported: {error}", file=sys.stderr)
+                return 1
+        print(f"{count} solutions imported", file=sys.stderr)
+        return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sliding puzzle solver.")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("gui", help="open the puzzle window (the default)")
+
+    solve = commands.add_parser("solve", help="solve boards from a file or stdin, write JSONL")
+    solve.add_argument("input", nargs="?", default="-",
+                       help="file with one comma-separated board per line (default: stdin)")
+    solve.add_argument("-o", "--output", default="-", help="JSONL output file (default: stdout)")
+    solve.add_argument("--goal", help="goal board (default: tiles in order, blank last)")
+    solve.add_argument("--width", type=int, help="board width (default: square boards)")
+    solve.add_argument("--method", choices=METHODS,
+                       help=f"default: table for boards of up to {MAX_TABLE_CELLS} cells, "
+                            "else astar")
+    solve.add_argument("--heuristic", default="manhattan", choices=sorted(HEURISTICS))
+    solve.add_argument("--max-nodes", type=int,
+                       help="give up on a board after this many expansions")
+    solve.add_argument("--max-time", type=float,
+                       help="give up on a board after this many seconds")
+    solve.add_argument("--workers", type=int, help="worker processes (default: all CPUs)")
+    solve.add_argument("--chunksize", type=int, default=64, help="boards per worker task")
+    solve.add_argument("--store", help="SQLite solution store to consult and add to")
+
+    store = commands.add_parser("store", help="import or export a solution store as JSONL")
+    store.add_argument("action", choices=("import", "export"))
+    store.add_argument("database", help="SQLite solution store file")
+    store.add_argument("file", nargs="?", default="-",
+                       help="JSONL file to read or write (default: stdin/stdout)")
+    store.add_argument("--goal", help="goal for imported records without one "
+                                      "(default: tiles in order, blank last)")
+    store.add_argument("--width", type=int, help="board width for imported records")
+
+    bench.add_arguments(commands.add_parser("bench", help="run the benchmark suite"))
+
+    args = parser.parse_args(argv)
+    if args.command == "solve":
+        return run_batch(args, solve)
+    if args.command == "bench":
+        return bench.run(args)
+    if args.command == "store":
+        return run_store(args, store)
+
+    from .gui import PuzzleGUI  # Tk is only needed for the window
+    app = PuzzleGUI(INITIAL_STATE, GOAL_STATE)
+    app.mainloop()
+    return 0
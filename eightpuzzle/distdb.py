@@ -0,0 +1,86 @@
+"""
+On-disk format for precomputed per-goal tables.
+
+A table file is a small header followed by the raw table bytes (one byte
+per ranked permutation for distance tables):
+
+    magic "PZDB" | format version | kind | width | height | cell count
+    goal state (one byte per cell)
+    extra length | extra bytes (kind specific, e.g. pattern tiles)
+    entry count (uint64)
+    table bytes
+
+Files are opened with mmap, so every process that loads the same table
+shares the same pages. The goal state is stored in the header and is part
+of the file name, so a table is never used for the wrong goal.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+
+MAGIC = b"PZDB"
+FORMAT_VERSION = 1
+
+KIND_DISTANCE = 0  # (distance << 2) | move, see lookup.py
+
+_HEADER = struct.Struct("<4sBBBBB")
+_COUNT = struct.Struct("<Q")
+
+TABLE_DIR = os.environ.get(
+    "PUZZLE_TABLE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "8-puzzle"))
+
+
+def table_path(goal_state, width=3, height=3, kind=KIND_DISTANCE, extra=b""):
+    """Returns the default file path for a table, versioned by goal state."""
+    name = f"k{kind}-{width}x{height}-" + "-".join(map(str, goal_state))
+    if extra:
+        name += "-x" + extra.hex()
+    return os.path.join(TABLE_DIR, name + ".pzdb")
+
+
+def _header(goal_state, width, height, kind, extra, count):
+    return (_HEADER.pack(MAGIC, FORMAT_VERSION, kind, width, height, len(goal_state))
+            + bytes(goal_state)
+            + bytes([len(extra)]) + bytes(extra)
+            + _COUNT.pack(count))
+
+
+def write_table(path, data, goal_state, width=3, height=3, kind=KIND_DISTANCE, extra=b""):
+    """Writes a table file atomically (write to a temp file, then rename)."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_header(goal_state, width, height, kind, extra, len(data)))
+            f.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_table(path, goal_state, width=3, height=3, kind=KIND_DISTANCE, extra=b""):
+    """
+    Memory-maps a table file and returns a read-only memoryview of its
+    entries. Raises ValueError if the header does not match the request.
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    expected = _header(goal_state, width, height, kind, extra, 0)[:-_COUNT.size]
+    if mapped[:len(expected)] != expected:
+        mapped.close()
+        raise ValueError(f"{path} is not a table for this goal/format")
+
+    offset = len(expected)
+    (count,) = _COUNT.unpack_from(mapped, offset)
+    offset += _COUNT.size
+    if len(mapped) - offset != count:
+        mapped.close()
+        raise ValueError(f"{path} is truncated")
+    return memoryview(mapped)[offset:]
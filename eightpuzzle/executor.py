@@ -0,0 +1,108 @@
+"""
+Runs the solver in a separate process for the GUI.
+
+A search is CPU-bound pure Python, so in a thread it competes with Tk's
+event loop for the GIL and the window stutters. SolverProcess keeps one
+worker process that takes jobs from a queue and runs solve_puzzle on each.
+The messages (progress records, then the solution_info dict) come back
+over a pipe. A listener thread in the parent moves each one to the
+`results` queue as it arrives and calls `notify`, so the GUI can react at
+once instead of polling. When the worker dies the pipe reports EOF and the
+listener exits.
+
+The worker is started with "spawn" rather than fork, so it never inherits
+the Tk interpreter or its X connection; it only imports the solver. Given
+a goal, it also loads that goal's tables in a background thread as soon
+as it starts; until the lookup table is ready, solves use A*.
+"""
+
+import multiprocessing
+import queue
+import threading
+
+from .solver import solve_puzzle, warm_up
+
+
+class _PipeWriter:
+    """Gives the sending end of a pipe the put() that solve_puzzle expects."""
+
+    def __init__(self, connection):
+        self.put = connection.send
+
+
+def _serve(jobs, connection, cancel, warm_goal):
+    """Worker process loop: solve jobs until a None job arrives."""
+    if warm_goal is not None:
+        threading.Thread(target=warm_up, args=warm_goal, daemon=True).start()
+    results = _PipeWriter(connection)
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        initial_state, goal_state, options = job
+        solve_puzzle(initial_state, goal_state, results, cancel=cancel, **options)
+
+
+def _listen(connection, results, notify):
+    """Listener thread: forwards messages from one worker until it exits."""
+    with connection:
+        while True:
+            try:
+                message = connection.recv()
+            except (EOFError, OSError):
+                return
+            results.put(message)
+            if notify is not None:
+                notify()
+
+
+class SolverProcess:
+    """
+    A solver worker process. submit() starts a solve, results is the queue
+    its messages arrive on, cancel() asks the search to stop with a partial
+    result and kill() terminates the worker outright (a fresh one is
+    started in its place). notify() is called from the listener thread
+    after each message is queued. If goal_state is given, each worker
+    starts loading its tables right away.
+    """
+
+    def __init__(self, notify=None, goal_state=None, width=None):
+        self._context = multiprocessing.get_context("spawn")
+        self._notify = notify
+        self._warm_goal = None if goal_state is None else (tuple(goal_state), width)
+        self._start()
+
+    def _start(self):
+        # New queues each time: a killed worker may leave them unusable
+        self._jobs = self._context.Queue()
+        self.results = queue.Queue()
+        self._cancel = self._context.Event()
+        receiver, sender = self._context.Pipe(duplex=False)
+        self.process = self._context.Process(
+            target=_serve, args=(self._jobs, sender, self._cancel, self._warm_goal),
+            daemon=True)
+        self.process.start()
+        sender.close()  # Only the worker writes, so its exit means EOF
+        threading.Thread(target=_listen, args=(receiver, self.results, self._notify),
+                         daemon=True).start()
+
+    def submit(self, initial_state, goal_state, **options):
+        """Queues a solve; options are passed on to solve_puzzle."""
+        self._cancel.clear()
+        self._jobs.put((initial_state, goal_state, options))
+
+    def cancel(self):
+        """Asks the running search to stop; it replies with a partial result."""
+        self._cancel.set()
+
+    def kill(self):
+        """Terminates the worker, dropping any running search, and starts a new one."""
+        self.process.terminate()
+        self.process.join()
+        self._start()
+
+    def close(self):
+        """Stops the worker process."""
+        self._cancel.set()
+        self.process.terminate()
+        self.process.join()
@@ -0,0 +1,352 @@
+"""
+Tkinter GUI for the puzzle solver. This is the only module that imports
+tkinter; the command-line entry point loads it only when the window is
+actually opened.
+"""
+
+import tkinter as tk
+from tkinter import messagebox
+import queue
+import random
+
+from .cache import SolutionCache, DEFAULT_CACHE_SIZE
+from .executor import SolverProcess
+from .moves import adjacency_table, board_width
+from .solver import parse_board
+
+CANCEL_GRACE_MS = 1000  # How long Cancel waits for a partial result before killing the solver
+
+
+class PuzzleGUI(tk.Tk):
+    def __init__(self, initial_state, goal_state, width=None, cache_size=DEFAULT_CACHE_SIZE):
+        super().__init__()
+        self.size = len(goal_state)
+        self.width = width or board_width(self.size)
+        self.height = self.size // self.width
+        self.title(f"AI {self.size - 1}-Puzzle Solver")
+        # Sized for 3x3; each extra row/column of tiles needs ~110px more
+        self.geometry(f"{350 + 110 * max(0, self.width - 3)}x{550 + 110 * (self.height - 3)}")
+        
+        self.initial_state = initial_state
+        self.goal_state = goal_state
+        self.current_state = initial_state
+        self.solution_path = []
+        self.animation_index = 0
+        self.allow_user_moves = True
+        
+        # --- Configure Colors and Fonts ---
+        self.tile_colors = {
+            0: "#CDC0B4", 1: "#EEE4DA", 2: "#EDE0C8",
+            3: "#F2B179", 4: "#F59563", 5: "#F67C5F",
+            6: "#F65E3B", 7: "#EDCF72", 8: "#EDCC61",
+        }
+        self.tile_font = ("Arial", 30, "bold")
+        self.button_font = ("Arial", 12, "bold")
+        self.input_font = ("Arial", 10)
+
+        # --- NEW: Create Input Frame (at the top) ---
+        self.input_frame = tk.Frame(self)
+        self.input_frame.pack(pady=10)
+        
+        self.input_label = tk.Label(self.input_frame, 
+                                     text=f"Enter state (e.g., {','.join(map(str, initial_state))}):",
+                                     font=self.input_font)
+        self.input_label.pack()
+        
+        self.input_entry = tk.Entry(self.input_frame, width=35, font=self.input_font)
+        self.input_entry.pack(side="left", padx=(10, 5))
+        
+        self.set_button = tk.Button(self.input_frame, text="Set",
+                                     font=self.button_font,
+                                     command=self.set_board_from_input)
+        self.set_button.pack(side="left")
+
+        # --- Create Main Frames ---
+        self.grid_frame = tk.Frame(self, bg="#92877d", bd=4)
+        self.grid_frame.pack(pady=10, padx=20)
+        
+        self.control_frame = tk.Frame(self)
+        self.control_frame.pack(fill="x", padx=20)
+
+        # --- Create Widgets ---
+        self.tile_labels = []
+        for i in range(self.size):
+            row, col = divmod(i, self.width)
+            label = tk.Label(self.grid_frame, text="", width=4, height=2,
+                              font=self.tile_font, relief="raised", bd=2)
+            label.grid(row=row, column=col, padx=3, pady=3)
+            label.bind("<Button-1>", lambda event, index=i: self.on_tile_click(index))
+            self.tile_labels.append(label)
+            
+        self.status_label = tk.Label(self.control_frame, text="Set up your puzzle or click 'Shuffle'",
+                                     font=("Arial", 12, "italic"), pady=10)
+        self.status_label.pack()
+        
+        self.button_frame = tk.Frame(self.control_frame)
+        self.button_frame.pack()
+
+        self.shuffle_button = tk.Button(self.button_frame, text="Shuffle",
+                                      font=self.button_font, bg="#8f7a66",
+                                      fg="white", command=self.shuffle_board)
+        self.shuffle_button.pack(side="left", expand=True, padx=5)
+
+        self.solve_button = tk.Button(self.button_frame, text="Solve",
+                                      font=self.button_font, bg="#8f7a66",
+                                      fg="white", command=self.start_solve)
+        self.solve_button.pack(side="left", expand=True, padx=5)
+        
+        self.reset_button = tk.Button(self.button_frame, text="Reset",
+                                      font=self.button_font, bg="#8f7a66",
+                                      fg="white", command=self.reset_board)
+        self.reset_button.pack(side="left", expand=True, padx=5)
+
+        self.cancel_button = tk.Button(self.button_frame, text="Cancel",
+                                       font=self.button_font, bg="#8f7a66",
+                                       fg="white", state="disabled",
+                                       command=self.cancel_solve)
+        self.cancel_button.pack(side="left", expand=True, padx=5)
+
+        # --- Initialize Board and Solver Queue ---
+        self.update_board_display(self.current_state)
+        self.input_entry.insert(0, ",".join(map(str, self.current_state))) # Pre-fill
+        self.solver = SolverProcess(notify=self.notify_solver_message,
+                                    goal_state=self.goal_state, width=self.width)
+        self.solution_cache = SolutionCache(cache_size)  # Survives Reset
+        self.bind("<<SolverMessage>>", self.check_solution_queue)
+        self.solving = False
+        self.cancelling = False
+        self.kill_timer = None  # after() id of a pending kill_solver
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+
+    def set_board_from_input(self):
+        """NEW: Validates and sets the board from the text entry."""
+        if not self.allow_user_moves: return # Don't set if solving
+
+        try:
+            board = parse_board(self.input_entry.get(), self.size)
+        except ValueError as error:
+            messagebox.showerror("Invalid Input", str(error))
+            return
+
+        # If all checks pass:
+        self.current_state = board
+        self.initial_state = self.current_state
+        self.update_board_display(self.current_state)
+        self.status_label.config(text="New board set. Click 'Solve'.")
+        self.reset_board() # Reset buttons to normal state
+
+
+    def update_board_display(self, state_tuple):
+        """Updates the grid labels to match the given state."""
+        self.current_state = state_tuple 
+        for i, tile_num in enumerate(state_tuple):
+            label = self.tile_labels[i]
+            if tile_num == 0:
+                label.config(text="", bg=self.tile_colors[0])
+            else:
+                label.config(text=str(tile_num), 
+                             bg=self.tile_colors.get(tile_num, "#CCC"),
+                             fg="#776E65")
+        self.update_idletasks()
+
+
+    def on_tile_click(self, clicked_index):
+        """Handles a user click on a tile."""
+        if not self.allow_user_moves:
+            return
+
+        state_list = list(self.current_state)
+        blank_index = state_list.index(0)
+        
+        if clicked_index in adjacency_table(self.width, self.height)[blank_index]:
+            state_list[blank_index], state_list[clicked_index] = \
+                state_list[clicked_index], state_list[blank_index]
+            
+            self.current_state = tuple(state_list)
+            self.initial_state = self.current_state
+            self.update_board_display(self.current_state)
+            self.input_entry.delete(0, tk.END) # Update entry box
+            self.input_entry.insert(0, ",".join(map(str, self.current_state)))
+            self.status_label.config(text="Board set. Click 'Solve' to begin.")
+
+
+    def shuffle_board(self):
+        """Generates a new, random, solvable puzzle."""
+        self.allow_user_moves = True
+        self.solve_button.config(state="normal")
+        
+        state = list(self.goal_state)
+        for _ in range(100):
+            blank_index = state.index(0)
+            swap_index = random.choice(adjacency_table(self.width, self.height)[blank_index])
+            state[blank_index], state[swap_index] = state[swap_index], state[blank_index]
+        
+        self.current_state = tuple(state)
+        self.initial_state = self.current_state
+        self.update_board_display(self.current_state)
+        self.input_entry.delete(0, tk.END) # Update entry box
+        self.input_entry.insert(0, ",".join(map(str, self.current_state)))
+        self.status_label.config(text="New puzzle generated. Click 'Solve'!")
+
+
+    def reset_board(self):
+        """Resets the board to the last initial state."""
+        self.current_state = self.initial_state
+        self.solution_path = []
+        self.animation_index = 0
+        self.allow_user_moves = True
+        self.update_board_display(self.current_state)
+        self.input_entry.delete(0, tk.END) # Update entry box
+        self.input_entry.insert(0, ",".join(map(str, self.current_state)))
+        self.status_label.config(text="Board reset. Set up or click 'Solve'.")
+        # Re-enable buttons
+        self.solve_button.config(state="normal")
+        self.shuffle_button.config(state="normal")
+        self.set_button.config(state="normal") # Enable set button
+
+
+    def start_solve(self):
+        """
+        Starts the A* solver in the solver process to prevent the GUI
+        from freezing.
+        """
+        self.allow_user_moves = False 
+        self.solve_button.config(state="disabled")
+        self.reset_button.config(state="disabled")
+        self.shuffle_button.config(state="disabled")
+        self.set_button.config(state="disabled") # Disable set button
+        self.status_label.config(text="Solving... This may take a moment.")
+
+        solution_info = self.solution_cache.lookup(self.current_state, self.goal_state, self.width)
+        if solution_info is not None:
+            self.handle_solution(solution_info)
+            return
+
+        self.cancel_button.config(state="normal")
+        self.stop_kill_timer()
+        self.solving = True
+        self.cancelling = False
+        self.solver.submit(self.current_state, self.goal_state, width=self.width)
+
+
+    def cancel_solve(self):
+        """
+        Asks the solver to stop; it answers with a partial result. If it
+        doesn't within CANCEL_GRACE_MS, the solver process is killed.
+        """
+        self.solver.cancel()
+        self.cancelling = True
+        self.cancel_button.config(state="disabled")
+        self.status_label.config(text="Cancelling...")
+        self.stop_kill_timer()
+        self.kill_timer = self.after(CANCEL_GRACE_MS, self.kill_solver)
+
+
+    def stop_kill_timer(self):
+        """Cancels the pending kill_solver call, so it can't hit a later solve."""
+        if self.kill_timer is not None:
+            self.after_cancel(self.kill_timer)
+            self.kill_timer = None
+
+
+    def kill_solver(self):
+        """Kills the solver process if the cancelled search is still running."""
+        self.kill_timer = None
+        if not (self.solving and self.cancelling):
+            return
+        self.solver.kill()
+        self.solving = False
+        self.reset_board()
+        self.status_label.config(text="Solver stopped.")
+
+
+    def on_close(self):
+        """Stops the solver process before closing the window."""
+        self.solver.close()
+        self.destroy()
+
+
+    def notify_solver_message(self):
+        """
+        Called from the solver's listener thread when a message arrives;
+        wakes the Tk loop with a virtual event.
+        """
+        try:
+            self.event_generate("<<SolverMessage>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            pass  # The window is closing
+
+
+    def check_solution_queue(self, event=None):
+        """
+        Handles the messages from the solver process, on each <<SolverMessage>>.
+        Progress records are drained and shown in the status line.
+        If the solution is found, starts the animation.
+        """
+        if not self.solving:
+            return  # The solver was killed
+        try:
+            solution_info = self.solver.results.get_nowait()
+            while solution_info and solution_info.get("progress"):
+                self.show_progress(solution_info)
+                solution_info = self.solver.results.get_nowait()
+        except queue.Empty:
+            return  # Only progress so far; the next message raises another event
+
+        self.solving = False
+        self.stop_kill_timer()
+        self.cancel_button.config(state="disabled")
+        self.solution_cache.store(solution_info, self.goal_state, self.width)
+        self.handle_solution(solution_info)
+
+
+    def handle_solution(self, solution_info):
+        """Shows a final solver result, animating the path if there is one."""
+        if solution_info and solution_info.get("stopped"):
+            self.reset_board()
+            self.status_label.config(
+                text=f"Stopped after {solution_info['explored']} nodes "
+                     f"(needs at least {solution_info['bound']} moves).")
+
+        elif solution_info and solution_info.get("unsolvable", False):
+            messagebox.showerror("No Solution", "This puzzle configuration is unsolvable.")
+            self.reset_board()
+        
+        elif solution_info:
+            self.solution_path = solution_info["path"]
+            self.animation_index = 0
+            cached = " (cached)" if solution_info.get("cached") else ""
+            self.status_label.config(
+                text=f"Solved in {solution_info['moves']} moves{cached}! Animating...")
+            self.animate_solution()
+        
+        else:
+             messagebox.showerror("No Solution", "An unknown error occurred.")
+             self.reset_board()
+
+
+    def show_progress(self, progress):
+        """Renders a solver progress record in the status line."""
+        if self.cancelling:
+            return  # Keep showing "Cancelling..."
+        self.status_label.config(
+            text=f"Solving... {progress['explored']:,} nodes, {progress['open']:,} open\n"
+                 f"f = {progress['bound']}, {progress['rate']:,.0f} nodes/s")
+
+
+    def animate_solution(self):
+        """Animates the solution path step by step."""
+        self.allow_user_moves = False 
+        
+        if self.animation_index < len(self.solution_path):
+            state = self.solution_path[self.animation_index]
+            self.update_board_display(state)
+            self.animation_index += 1
+            self.after(400, self.animate_solution) # 400ms delay
+        else:
+            self.status_label.config(text="Animation complete!")
+            self.reset_button.config(state="normal")
+            self.shuffle_button.config(state="normal")
+            self.set_button.config(state="normal") # Re-enable set
+            self.allow_user_moves = True
@@ -0,0 +1,250 @@
+"""
+The solver's heuristics (Manhattan distance, linear conflict, pattern
+databases, walking distance) and a registry to pick them by name.
+
+Tables are built once per goal state and cached, so the solver never has
+to rebuild the goal positions for each state it scores.
+"""
+
+from functools import lru_cache
+
+# Tables are cached per goal. Bidirectional search also builds tables for
+# its start states, so the caches are bounded rather than kept forever.
+GOAL_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=GOAL_CACHE_SIZE)
+def manhattan_table(goal_state, width=3):
+    """
+    Returns distance[tile][index]: how far `tile` sitting at `index` is
+    from its goal cell. The blank's row is all zeros.
+    """
+    size = len(goal_state)
+    table = [[0] * size for _ in range(size)]
+    for goal_index, tile in enumerate(goal_state):
+        if tile == 0:
+            continue
+        goal_row, goal_col = divmod(goal_index, width)
+        for index in range(size):
+            row, col = divmod(index, width)
+            table[tile][index] = abs(row - goal_row) + abs(col - goal_col)
+    return table
+
+
+@lru_cache(maxsize=GOAL_CACHE_SIZE)
+def manhattan_delta_table(goal_state, width=3):
+    """
+    Returns delta[tile][from_index][to_index]: the change in Manhattan
+    distance when `tile` slides from one cell to another.
+    """
+    table = manhattan_table(goal_state, width)
+    return [[[to_dist - from_dist for to_dist in row] for from_dist in row]
+            for row in table]
+
+
+# -----------------------------------------------------------------------
+# Linear conflict
+# -----------------------------------------------------------------------
+# Two tiles that are both in their goal line (row or column) but in the
+# wrong order have to pass each other, which costs at least 2 moves on top
+# of their Manhattan distance. For one line, the number of tiles that must
+# leave it is (tiles in their goal line) - (longest increasing run of their
+# goal positions).
+#
+# The conflict count depends only on which goal positions occupy the line,
+# so it is precomputed per line length. A line's key has one base-(L+1)
+# digit per cell: the tile's goal position along the line, or L if the
+# tile (or blank) belongs to another line.
+
+@lru_cache(maxsize=None)
+def conflict_table(length):
+    """Returns conflicts[key]: extra moves for a line with the given key."""
+    base = length + 1
+    table = bytearray(base ** length)
+    for key in range(len(table)):
+        digits = []
+        rest = key
+        for _ in range(length):
+            rest, digit = divmod(rest, base)
+            if digit < length:
+                digits.append(digit)
+        digits.reverse()  # First cell is the most significant digit
+
+        # Longest increasing subsequence of goal positions
+        longest = [1] * len(digits)
+        for i in range(len(digits)):
+            for j in range(i):
+                if digits[j] < digits[i] and longest[j] + 1 > longest[i]:
+                    longest[i] = longest[j] + 1
+        table[key] = 2 * (len(digits) - max(longest, default=0))
+    return table
+
+
+@lru_cache(maxsize=GOAL_CACHE_SIZE)
+def linear_conflict_tables(goal_state, width=3):
+    """
+    Returns (rows, columns) for a goal. Each is a list of lines, and each
+    line is (cell indices, digit[tile], conflict table).
+    """
+    size = len(goal_state)
+    height = size // width
+    row_digits = [[width] * size for _ in range(height)]
+    col_digits = [[height] * size for _ in range(width)]
+    for goal_index, tile in enumerate(goal_state):
+        if tile == 0:
+            continue
+        goal_row, goal_col = divmod(goal_index, width)
+        row_digits[goal_row][tile] = goal_col
+        col_digits[goal_col][tile] = goal_row
+
+    rows = [(tuple(range(r * width, (r + 1) * width)), row_digits[r], conflict_table(width))
+            for r in range(height)]
+    columns = [(tuple(range(c, size, width)), col_digits[c], conflict_table(height))
+               for c in range(width)]
+    return rows, columns
+
+
+def _line_conflicts(state, line, changed_index=-1, changed_tile=0):
+    """Conflicts in one line, optionally with one cell replaced."""
+    cells, digits, table = line
+    base = len(cells) + 1
+    key = 0
+    for index in cells:
+        tile = changed_tile if index == changed_index else state[index]
+        key = key * base + digits[tile]
+    return table[key]
+
+
+def linear_conflict(state, goal_state, width=3):
+    """Extra moves from linear conflicts (add to Manhattan distance)."""
+    rows, columns = linear_conflict_tables(goal_state, width)
+    return (sum(_line_conflicts(state, line) for line in rows)
+            + sum(_line_conflicts(state, line) for line in columns))
+
+
+def linear_conflict_delta(state, goal_state, width, blank_index, swap_index):
+    """
+    Change in linear conflict when the tile at `swap_index` slides into the
+    blank. A horizontal move keeps the tile's row order, so only the two
+    columns change; a vertical move only changes the two rows.
+    """
+    rows, columns = linear_conflict_tables(goal_state, width)
+    blank_row, blank_col = divmod(blank_index, width)
+    swap_row, swap_col = divmod(swap_index, width)
+    if blank_row == swap_row:
+        first, second = columns[blank_col], columns[swap_col]
+    else:
+        first, second = rows[blank_row], rows[swap_row]
+
+    before = _line_conflicts(state, first) + _line_conflicts(state, second)
+    after = (_line_conflicts(state, first, blank_index, state[swap_index])
+             + _line_conflicts(state, second, swap_index, 0))
+    return after - before
+
+
+# -----------------------------------------------------------------------
+# Heuristic registry
+# -----------------------------------------------------------------------
+# A heuristic is compiled once per (goal, width): building the object
+# builds its tables. After that it scores a whole board with h(board) and
+# updates a parent's score for one move with delta(). Solvers look
+# heuristics up by name through get_heuristic().
+
+class Heuristic:
+    """Base class for heuristics compiled for one goal state."""
+
+    name = None
+    # False if delta() only needs the moved tile, so callers holding a
+    # packed state can skip unpacking the board
+    needs_board = True
+    # False if compiling for a new goal is expensive (big tables), so
+    # searches that need a heuristic toward each start state avoid it
+    cheap_to_compile = True
+
+    def __init__(self, goal_state, width=3):
+        self.goal_state = tuple(goal_state)
+        self.width = width
+
+    def h(self, board):
+        """Estimated moves from a board tuple/list to the goal."""
+        raise NotImplementedError
+
+    def delta(self, parent_h, board, tile, blank_index, swap_index):
+        """
+        Returns the child's h after `tile` slides from `swap_index` into the
+        blank at `blank_index`. `board` is the parent board (None if
+        needs_board is False).
+        """
+        raise NotImplementedError
+
+
+class ManhattanDistance(Heuristic):
+    name = "manhattan"
+    needs_board = False
+
+    def __init__(self, goal_state, width=3):
+        super().__init__(goal_state, width)
+        self.distance = manhattan_table(self.goal_state, width)
+        self.tile_delta = manhattan_delta_table(self.goal_state, width)
+
+    def h(self, board):
+        distance = self.distance
+        return sum(distance[tile][i] for i, tile in enumerate(board))
+
+    def delta(self, parent_h, board, tile, blank_index, swap_index):
+        return parent_h + self.tile_delta[tile][swap_index][blank_index]
+
+
+class LinearConflict(ManhattanDistance):
+    name = "linear_conflict"
+    needs_board = True
+
+    def __init__(self, goal_state, width=3):
+        super().__init__(goal_state, width)
+        linear_conflict_tables(self.goal_state, width)
+
+    def h(self, board):
+        return super().h(board) + linear_conflict(board, self.goal_state, self.width)
+
+    def delta(self, parent_h, board, tile, blank_index, swap_index):
+        return (parent_h + self.tile_delta[tile][swap_index][blank_index]
+                + linear_conflict_delta(board, self.goal_state, self.width,
+                                        blank_index, swap_index))
+
+
+def _pattern_database(goal_state, width=3):
+    # Imported here so NumPy is only needed when PDBs are actually used
+    from .pattern_db import get_pattern_database
+    return get_pattern_database(goal_state, width)
+
+
+def _walking_distance(goal_state, width=3):
+    from .walking import WalkingDistance
+    return WalkingDistance(goal_state, width)
+
+
+HEURISTICS = {}
+
+
+def register_heuristic(name, factory):
+    """
+    Makes a heuristic available by name. `factory(goal_state, width)`
+    returns a compiled Heuristic (usually it is the class itself).
+    """
+    HEURISTICS[name] = factory
+
+
+register_heuristic("manhattan", ManhattanDistance)
+register_heuristic("linear_conflict", LinearConflict)
+register_heuristic("pdb", _pattern_database)
+register_heuristic("walking_distance", _walking_distance)
+
+
+@lru_cache(maxsize=GOAL_CACHE_SIZE)
+def get_heuristic(name, goal_state, width=3):
+    """Returns the compiled heuristic `name` for a goal, building it on first use."""
+    try:
+        factory = HEURISTICS[name]
+    except KeyError:
+        raise ValueError(f"unknown heuristic {name!r}") from None
+    return factory(tuple(goal_state), width)
@@ -0,0 +1,97 @@
+"""
+IDA* solver.
+
+Depth-first search under an increasing f-bound, working on a single mutable
+board: each move swaps the blank in place and is undone on the way back.
+Nothing is stored per visited state, so memory stays O(solution depth),
+which is what makes the 15-puzzle practical.
+"""
+
+import sys
+import time
+
+from .heuristics import get_heuristic
+from .limits import SearchLimits
+from .moves import move_table
+
+FOUND = -1
+STOPPED = -2
+
+
+def ida_star(initial_state, goal_state, width=3, heuristic="manhattan", limits=None):
+    """
+    Solves a board with IDA* and any registered heuristic (see
+    heuristics.HEURISTICS). Returns the same solution_info dict shape as
+    the A* solver.
+    """
+    goal_state = tuple(goal_state)
+    limits = limits or SearchLimits()
+    scorer = get_heuristic(heuristic, goal_state, width)
+    child_h_cost = scorer.delta
+    size = len(goal_state)
+    moves = move_table(width, size // width)
+    goal = list(goal_state)
+
+    start_time = time.time()
+    board = list(initial_state)
+    blank_path = [board.index(0)]  # Blank position after each move
+    explored = 0
+
+    def search(g, h, bound):
+        nonlocal explored
+        f = g + h
+        if f > bound:
+            return f
+        if h == 0 and board == goal:
+            return FOUND
+        if explored >= limits.check_at and limits.check(explored, len(blank_path), bound):
+            return STOPPED
+        explored += 1
+
+        blank_index = blank_path[-1]
+        previous = blank_path[-2] if len(blank_path) > 1 else -1
+        minimum = sys.maxsize
+        for swap_index, _ in moves[blank_index]:
+            if swap_index == previous:  # Don't undo the last move
+                continue
+            tile = board[swap_index]
+            child_h = child_h_cost(h, board, tile, blank_index, swap_index)
+            board[blank_index], board[swap_index] = tile, 0
+            blank_path.append(swap_index)
+
+            result = search(g + 1, child_h, bound)
+            if result == FOUND or result == STOPPED:
+                return result
+
+            blank_path.pop()
+            board[blank_index], board[swap_index] = 0, tile
+            if result < minimum:
+                minimum = result
+        return minimum
+
+    start_h = scorer.h(initial_state)
+    bound = start_h
+    while True:
+        result = search(0, start_h, bound)
+        if result == FOUND:
+            break
+        if result == STOPPED:
+            return limits.result(start_time, explored, bound)
+        if result == sys.maxsize:
+            return None
+        bound = result
+
+    # Replay the blank positions to recover the states for the path
+    board = list(initial_state)
+    path = [tuple(board)]
+    for blank_index, swap_index in zip(blank_path, blank_path[1:]):
+        board[blank_index], board[swap_index] = board[swap_index], board[blank_index]
+        path.append(tuple(board))
+
+    return {
+        "unsolvable": False,
+        "path": path,
+        "time": time.time() - start_time,
+        "moves": len(path) - 1,
+        "explored": explored
+    }
@@ -0,0 +1,99 @@
+"""
+Search limits: a cancellation token plus optional node and time budgets,
+and periodic progress reports.
+
+Solvers count their expansions and call check() whenever the count
+reaches check_at, which is every CHECK_INTERVAL expansions (or sooner, to
+stop exactly at a node budget). With no limits and no progress callback
+check_at is infinite, so an unlimited search pays for one comparison per
+expansion.
+
+The cancellation token is anything with an is_set() method, such as a
+threading.Event or multiprocessing.Event set by another thread or process.
+
+Progress records are dicts with "progress": True, so they can share a
+queue with the final solution_info:
+
+    {"progress": True, "explored": nodes expanded so far,
+     "open": open-list size (current path depth for IDA*),
+     "bound": current f-value or f-bound, "rate": nodes/sec since the
+     last report, "time": seconds since the search started}
+"""
+
+import time
+
+CHECK_INTERVAL = 1024
+PROGRESS_INTERVAL = 0.5  # Seconds between progress reports
+
+CANCELLED = "cancelled"
+NODE_LIMIT = "node_limit"
+TIME_LIMIT = "time_limit"
+
+
+class SearchLimits:
+    """
+    Decides when a search has to stop early, and why. If `progress` is
+    given, it is called with a progress record about every
+    `progress_interval` seconds.
+    """
+
+    def __init__(self, cancel=None, max_nodes=None, max_time=None,
+                 progress=None, progress_interval=PROGRESS_INTERVAL):
+        self.cancel = cancel
+        self.max_nodes = max_nodes
+        self.start_time = time.time()
+        self.deadline = None if max_time is None else self.start_time + max_time
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.last_report = (self.start_time, 0)
+        self.reason = None
+        self.check_at = 0 if self.limited else float("inf")
+
+    @property
+    def limited(self):
+        return (self.cancel is not None or self.max_nodes is not None
+                or self.deadline is not None or self.progress is not None)
+
+    def check(self, explored, open_count=0, bound=0):
+        """Returns the stop reason once a limit is hit, else None."""
+        now = time.time()
+        if self.cancel is not None and self.cancel.is_set():
+            self.reason = CANCELLED
+        elif self.max_nodes is not None and explored >= self.max_nodes:
+            self.reason = NODE_LIMIT
+        elif self.deadline is not None and now >= self.deadline:
+            self.reason = TIME_LIMIT
+        else:
+            self.check_at = explored + CHECK_INTERVAL
+            if self.max_nodes is not None:
+                self.check_at = min(self.check_at, self.max_nodes)
+            if self.progress is not None and now - self.last_report[0] >= self.progress_interval:
+                self.report(now, explored, open_count, bound)
+        return self.reason
+
+    def report(self, now, explored, open_count, bound):
+        last_time, last_explored = self.last_report
+        elapsed = now - last_time
+        self.last_report = (now, explored)
+        self.progress({
+            "progress": True,
+            "explored": explored,
+            "open": open_count,
+            "bound": bound,
+            "rate": (explored - last_explored) / elapsed if elapsed > 0 else 0.0,
+            "time": now - self.start_time,
+        })
+
+    def result(self, start_time, explored, bound):
+        """
+        The partial-progress solution_info returned instead of a solution:
+        why the search stopped, how far it got, and `bound`, a lower bound
+        on the solution length (the last f-value or f-bound reached).
+        """
+        return {
+            "unsolvable": False,
+            "stopped": self.reason,
+            "time": time.time() - start_time,
+            "explored": explored,
+            "bound": bound,
+        }
@@ -0,0 +1,136 @@
+"""
+Perfect lookup table for small boards (the 8-puzzle and smaller).
+
+A single retrograde BFS from the goal records, for every reachable state,
+its exact distance to the goal and the blank move that starts an optimal
+solution. Entries are indexed by the permutation rank of the board and
+packed into one byte each: (distance << 2) | move code. Once the table is
+built a solve is just a walk of `distance` lookups, with no search at all.
+
+Built tables are saved with distdb and memory-mapped on later runs, so
+only the first process for a given goal pays for the BFS.
+"""
+
+import os
+import threading
+import time
+from math import factorial
+
+from . import distdb
+from .moves import DIRECTIONS, MOVE_CODES, move_table
+from .packing import pack_state, unpack_state, move_blank
+from .ranking import rank
+
+MAX_TABLE_CELLS = 9  # 9! entries; larger boards are left to search
+UNREACHABLE = 0xFF
+
+_tables = {}
+_tables_lock = threading.Lock()
+
+
+def build_table(goal_state, width=3):
+    """Runs the retrograde BFS from `goal_state` and returns the byte table."""
+    size = len(goal_state)
+    if size > MAX_TABLE_CELLS:
+        raise ValueError(f"lookup tables only cover boards of up to {MAX_TABLE_CELLS} cells")
+
+    # For each blank index: (swap_index, code of the move that undoes it)
+    reverse_moves = [[(swap_index, MOVE_CODES[move_name] ^ 1) for swap_index, move_name in moves]
+                     for moves in move_table(width, size // width)]
+
+    table = bytearray([UNREACHABLE]) * factorial(size)
+    goal = pack_state(goal_state)
+    table[rank(goal_state)] = 0
+    seen = {goal}
+    frontier = [(goal, goal_state.index(0))]
+    depth = 0
+
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for state, blank_index in frontier:
+            for swap_index, back_code in reverse_moves[blank_index]:
+                child = move_blank(state, blank_index, swap_index)
+                if child in seen:
+                    continue
+                seen.add(child)
+                table[rank(unpack_state(child, size))] = (depth << 2) | back_code
+                next_frontier.append((child, swap_index))
+        frontier = next_frontier
+
+    return table
+
+
+def load_or_build_table(goal_state, width=3, path=None):
+    """
+    Memory-maps the saved table for `goal_state`, or builds and saves it
+    if there is none yet. Failing to save only costs a rebuild next time.
+    """
+    goal_state = tuple(goal_state)
+    height = len(goal_state) // width
+    if path is None:
+        path = distdb.table_path(goal_state, width, height)
+
+    try:
+        return distdb.read_table(path, goal_state, width, height)
+    except (OSError, ValueError):
+        pass
+
+    table = build_table(goal_state, width)
+    try:
+        distdb.write_table(path, table, goal_state, width, height)
+    except OSError:
+        pass
+    return table
+
+
+def get_table(goal_state, width=3):
+    """Returns the table for `goal_state`, loading or building it on first use."""
+    key = (tuple(goal_state), width)
+    with _tables_lock:
+        table = _tables.get(key)
+        if table is None:
+            table = load_or_build_table(goal_state, width)
+            _tables[key] = table
+    return table
+
+
+def table_available(goal_state, width=3):
+    """Whether the table for `goal_state` is loaded or saved, so using it needs no BFS."""
+    goal_state = tuple(goal_state)
+    if (goal_state, width) in _tables:
+        return True
+    return os.path.exists(distdb.table_path(goal_state, width, len(goal_state) // width))
+
+
+def solve_with_table(initial_state, goal_state, width=3):
+    """
+    Solves a board by walking the lookup table. Returns the same
+    solution_info dict shape as the A* solver; its "time" includes
+    loading (or building) the table.
+    """
+    start_time = time.time()
+    table = get_table(goal_state, width)
+
+    entry = table[rank(initial_state)]
+    if entry == UNREACHABLE:
+        return {"unsolvable": True}
+
+    offsets = [dr * width + dc for dr, dc, _ in DIRECTIONS]
+    state = list(initial_state)
+    blank_index = state.index(0)
+    path = [tuple(state)]
+    for _ in range(entry >> 2):
+        swap_index = blank_index + offsets[entry & 3]
+        state[blank_index], state[swap_index] = state[swap_index], state[blank_index]
+        blank_index = swap_index
+        path.append(tuple(state))
+        entry = table[rank(state)]
+
+    return {
+        "unsolvable": False,
+        "path": path,
+        "time": time.time() - start_time,
+        "moves": len(path) - 1,
+        "explored": 0
+    }
@@ -0,0 +1,78 @@
+"""
+Precomputed move tables for a board geometry.
+
+For every blank index the table lists the cells the blank can swap with and
+the name of the move, so expanding a state is a lookup instead of coordinate
+arithmetic and bounds checks.
+"""
+
+from functools import lru_cache
+from math import isqrt
+
+# Direction the blank travels, as (row delta, col delta, name)
+DIRECTIONS = (
+    (-1, 0, 'UP'), (1, 0, 'DOWN'),
+    (0, -1, 'LEFT'), (0, 1, 'RIGHT'),
+)
+
+# Move name -> small integer code (its index in DIRECTIONS)
+MOVE_CODES = {name: code for code, (_, _, name) in enumerate(DIRECTIONS)}
+
+
+def board_width(size):
+    """Width of a square board with `size` cells."""
+    width = isqrt(size)
+    if width * width != size:
+        raise ValueError(f"a board of {size} cells is not square; pass width explicitly")
+    return width
+
+
+@lru_cache(maxsize=None)
+def move_table(width=3, height=3):
+    """Returns moves[blank_index] -> ((swap_index, move_name), ...)."""
+    table = []
+    for blank_index in range(width * height):
+        blank_row, blank_col = divmod(blank_index, width)
+        moves = []
+        for dr, dc, move_name in DIRECTIONS:
+            new_row, new_col = blank_row + dr, blank_col + dc
+            if 0 <= new_row < height and 0 <= new_col < width:
+                moves.append((new_row * width + new_col, move_name))
+        table.append(tuple(moves))
+    return tuple(table)
+
+
+def moves_from_path(path, width=3):
+    """Names of the blank moves that take each state in `path` to the next."""
+    names = {dr * width + dc: name for dr, dc, name in DIRECTIONS}
+    blanks = [state.index(0) for state in path]
+    return [names[after - before] for before, after in zip(blanks, blanks[1:])]
+
+
+def path_from_moves(state, moves, width=3):
+    """
+    Replays blank moves from `state` and returns the states visited.
+    Moves may be names or their first letters, e.g. "UULR". Raises
+    ValueError for a move that would take the blank off the board.
+    """
+    table = move_table(width, len(state) // width)
+    board = list(state)
+    blank_index = board.index(0)
+    path = [tuple(board)]
+    for step, move in enumerate(moves, 1):
+        for swap_index, move_name in table[blank_index]:
+            if move_name[0] == move[0]:
+                break
+        else:
+            raise ValueError(f"move {step} ({move!r}) is not legal from blank cell {blank_index}")
+        board[blank_index], board[swap_index] = board[swap_index], 0
+        blank_index = swap_index
+        path.append(tuple(board))
+    return path
+
+
+@lru_cache(maxsize=None)
+def adjacency_table(width=3, height=3):
+    """Returns adjacent[index] -> tuple of cell indices next to `index`."""
+    return tuple(tuple(swap_index for swap_index, _ in moves)
+                 for moves in move_table(width, height))
@@ -0,0 +1,49 @@
+"""
+Compact storage for A* search nodes.
+
+Instead of one Python object per node, nodes live in parallel typed arrays
+and a node is just its index. The parent link is an index too, so a path
+is rebuilt by following integers back to the root. That is ~22 bytes per
+node instead of a full object with its own __dict__.
+"""
+
+from array import array
+
+NO_PARENT = -1
+NO_MOVE = -1
+
+
+class NodeStore:
+    """Parallel arrays of (state, parent index, g, h, blank index, move code)."""
+
+    def __init__(self, state_bits=64):
+        # Packed states wider than 64 bits (boards over 16 cells) can't go
+        # in a typed array, so they fall back to a plain list
+        self.states = array("Q") if state_bits <= 64 else []
+        self.parents = array("q")
+        self.g_costs = array("H")
+        self.h_costs = array("H")
+        self.blanks = array("B")
+        self.moves = array("b")
+
+    def __len__(self):
+        return len(self.parents)
+
+    def add(self, state, parent, g_cost, h_cost, blank, move=NO_MOVE):
+        """Appends a node and returns its index."""
+        self.states.append(state)
+        self.parents.append(parent)
+        self.g_costs.append(g_cost)
+        self.h_costs.append(h_cost)
+        self.blanks.append(blank)
+        self.moves.append(move)
+        return len(self.parents) - 1
+
+    def path(self, index):
+        """Returns the states from the root to node `index`."""
+        states, parents = self.states, self.parents
+        path = []
+        while index != NO_PARENT:
+            path.append(states[index])
+            index = parents[index]
+        return path[::-1]
@@ -0,0 +1,68 @@
+"""
+Bucket-based open list for searches with small integer costs.
+
+Items live in buckets[f][g]. Pushing is an append, and popping takes from
+the lowest non-empty f, preferring the highest g inside it (the node
+closest to the goal among equals). Both are O(1) amortised, with no
+comparisons between items and no tie-break counter.
+"""
+
+from collections import deque
+
+
+class BucketQueue:
+    """Priority queue keyed by (lowest f, highest g); LIFO or FIFO within a bucket."""
+
+    def __init__(self, lifo=True):
+        self.buckets = []   # buckets[f][g] -> items
+        self.max_g = []     # max_g[f] -> highest g that may be non-empty
+        self.min_f = 0      # lowest f that may be non-empty
+        self.size = 0
+        self.lifo = lifo
+        self._new_bucket = list if lifo else deque
+
+    def __len__(self):
+        return self.size
+
+    def push(self, item, f, g):
+        """Adds an item with the given f- and g-cost."""
+        while len(self.buckets) <= f:
+            self.buckets.append([])
+            self.max_g.append(-1)
+        by_g = self.buckets[f]
+        while len(by_g) <= g:
+            by_g.append(self._new_bucket())
+        by_g[g].append(item)
+        if g > self.max_g[f]:
+            self.max_g[f] = g
+        if f < self.min_f:
+            self.min_f = f
+        self.size += 1
+
+    def _advance(self):
+        """Moves min_f/max_g to the next non-empty bucket."""
+        buckets, max_g = self.buckets, self.max_g
+        f = self.min_f
+        while True:
+            g = max_g[f]
+            by_g = buckets[f]
+            while g >= 0 and not by_g[g]:
+                g -= 1
+            max_g[f] = g
+            if g >= 0:
+                self.min_f = f
+                return f, g
+            f += 1
+
+    def peek_f(self):
+        """Returns the lowest f in the queue (the queue must not be empty)."""
+        return self._advance()[0]
+
+    def pop(self):
+        """Removes and returns an item with the lowest f (highest g among those)."""
+        if not self.size:
+            raise IndexError("pop from an empty BucketQueue")
+        f, g = self._advance()
+        self.size -= 1
+        bucket = self.buckets[f][g]
+        return bucket.pop() if self.lifo else bucket.popleft()
@@ -0,0 +1,44 @@
+"""
+Packed integer encoding for puzzle states.
+
+A board is stored as one integer with a fixed number of bits per cell, cell
+0 in the lowest bits. 4 bits cover boards up to 4x4 (a 3x3 board fits in 36
+bits); larger boards need more, see cell_bits(). States then hash and
+compare as ints and a move is a couple of shifts and masks instead of a new
+list and tuple.
+"""
+
+BITS_PER_CELL = 4
+
+
+def cell_bits(size):
+    """Bits per cell needed to pack a board with `size` cells."""
+    return max(BITS_PER_CELL, (size - 1).bit_length())
+
+
+def pack_state(state, bits=BITS_PER_CELL):
+    """Packs a board tuple into a single integer."""
+    packed = 0
+    for i, tile in enumerate(state):
+        packed |= tile << (i * bits)
+    return packed
+
+
+def unpack_state(packed, size=9, bits=BITS_PER_CELL):
+    """Unpacks an integer back into a board tuple of `size` cells."""
+    mask = (1 << bits) - 1
+    return tuple((packed >> (i * bits)) & mask for i in range(size))
+
+
+def get_tile(packed, index, bits=BITS_PER_CELL):
+    """Returns the tile stored at cell `index` of a packed board."""
+    return (packed >> (index * bits)) & ((1 << bits) - 1)
+
+
+def move_blank(packed, blank_index, swap_index, bits=BITS_PER_CELL):
+    """
+    Slides the tile at `swap_index` into the blank at `blank_index`.
+    The blank cell is zero, so XOR-ing the tile into both cells moves it.
+    """
+    tile = (packed >> (swap_index * bits)) & ((1 << bits) - 1)
+    return packed ^ (tile << (swap_index * bits)) ^ (tile << (blank_index * bits))
@@ -0,0 +1,193 @@
+"""
+Additive disjoint pattern databases.
+
+The tiles are split into disjoint groups. For each group a BFS over the
+positions of that group's tiles and the blank records how many moves of
+those tiles are needed to bring them home. The other tiles are
+indistinguishable and moving them is free, but a group tile can still
+only move into the blank, so the blank has to be brought round to it.
+Every real move moves exactly one tile, so the per-group costs add up to
+an admissible heuristic, which on the 15-puzzle is far stronger than
+linear conflict.
+
+Each table is a NumPy uint8 array indexed by rank_partial() of the group's
+tile positions followed by the blank's. Keeping the blank in the key (not
+the minimum over blank cells) keeps the heuristic consistent: moving
+another tile is free both ways, so it never changes a group's cost, and
+moving a group tile changes only that group's cost, by one. Tables are
+saved with distdb and memory-mapped on later runs, so each (goal, group)
+is only built once; a 5-tile 4x4 group has 16!/10! entries and takes
+several seconds.
+"""
+
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+from . import distdb
+from .heuristics import Heuristic
+from .moves import DIRECTIONS
+from .ranking import partial_count, rank_partial, rank_partial_many
+
+KIND_PATTERN = 3  # 1 was the older table built without the blank
+UNSEEN = 0xFF
+
+
+def default_partition(goal_state, width=3):
+    """
+    Splits the tiles into groups of neighbouring goal cells: 4+4 for 3x3,
+    5+5+5 for 4x4 and groups of 4 for larger boards (bigger groups are
+    too slow to build in Python). Groups of 4 are too small to reliably
+    beat linear conflict on 5x5 boards.
+    """
+    group_size = 5 if len(goal_state) == 16 else 4
+    tiles = [tile for tile in goal_state if tile != 0]
+    return tuple(tuple(tiles[i:i + group_size]) for i in range(0, len(tiles), group_size))
+
+
+def _blank_moves(states, k, width, height, dr, dc):
+    """
+    Moves the blank (last column) of each state one cell in a direction.
+    Returns the children split into those where it swapped with a non-group
+    cell (free) and those where it swapped with a group tile (one move).
+    """
+    blank = states[:, k]
+    row, col = blank // width + dr, blank % width + dc
+    target = row * width + col
+    valid = (row >= 0) & (row < height) & (col >= 0) & (col < width)
+    hit = states[:, :k] == target[:, None]
+    occupied = hit.any(axis=1)
+
+    free = states[valid & ~occupied]
+    free[:, k] = target[valid & ~occupied]
+
+    paid = valid & occupied
+    moved = states[paid]
+    moved[:, :k] = np.where(hit[paid], blank[paid, None], moved[:, :k])
+    moved[:, k] = target[paid]
+    return free, moved
+
+
+def _mark(children, table, depth, size):
+    """Records unseen children at `depth`; returns them, one row per state."""
+    ranks = rank_partial_many(children, size)
+    fresh = table[ranks] == UNSEEN
+    ranks, first = np.unique(ranks[fresh], return_index=True)
+    table[ranks] = depth
+    return children[fresh][first]
+
+
+def build_pattern_table(goal_state, width, tiles):
+    """
+    Runs the BFS for one tile group and returns its cost table.
+
+    The BFS state is the group's tile positions plus the blank's. Sliding
+    any other tile into the blank is free and sliding a group tile costs
+    one move, so each cost level is first closed under free moves before
+    the paid ones start the next level.
+    """
+    size = len(goal_state)
+    height = size // width
+    k = len(tiles)
+    table = np.full(partial_count(size, k + 1), UNSEEN, dtype=np.uint8)
+
+    start = [goal_state.index(tile) for tile in tiles] + [goal_state.index(0)]
+    frontier = np.array([start], dtype=np.int64)
+    table[rank_partial_many(frontier, size)] = 0
+    depth = 0
+
+    while len(frontier):
+        # Everything the blank reaches without moving a group tile
+        level = [frontier]
+        queue = frontier
+        while len(queue):
+            reached = [_mark(_blank_moves(queue, k, width, height, dr, dc)[0],
+                             table, depth, size)
+                       for dr, dc, _ in DIRECTIONS]
+            queue = np.concatenate(reached)
+            level.append(queue)
+        level = np.concatenate(level)
+
+        depth += 1
+        if depth >= UNSEEN:
+            raise ValueError("pattern distances do not fit in a byte")
+        # One direction at a time keeps the temporaries small
+        frontier = np.concatenate([
+            _mark(_blank_moves(level, k, width, height, dr, dc)[1], table, depth, size)
+            for dr, dc, _ in DIRECTIONS])
+
+    return table
+
+
+def load_or_build_pattern_table(goal_state, width, tiles):
+    """Memory-maps a saved group table, or builds and saves it."""
+    height = len(goal_state) // width
+    extra = bytes(tiles)
+    path = distdb.table_path(goal_state, width, height, KIND_PATTERN, extra)
+    try:
+        data = distdb.read_table(path, goal_state, width, height, KIND_PATTERN, extra)
+        return np.frombuffer(data, dtype=np.uint8)
+    except (OSError, ValueError):
+        pass
+
+    table = build_pattern_table(goal_state, width, tiles)
+    try:
+        distdb.write_table(path, table.tobytes(), goal_state, width, height,
+                           KIND_PATTERN, extra)
+    except OSError:
+        pass
+    return table
+
+
+class PatternDatabase(Heuristic):
+    """Additive heuristic over a partition of the tiles into groups."""
+
+    name = "pdb"
+    cheap_to_compile = False
+
+    def __init__(self, goal_state, width=3, partition=None):
+        super().__init__(goal_state, width)
+        self.size = len(goal_state)
+        self.partition = partition or default_partition(self.goal_state, width)
+        self.tables = [load_or_build_pattern_table(self.goal_state, width, tiles)
+                       for tiles in self.partition]
+        self.group_of = {tile: g for g, tiles in enumerate(self.partition) for tile in tiles}
+
+    def _group_cost(self, group, positions):
+        return int(self.tables[group][rank_partial(positions, self.size)])
+
+    def h(self, board):
+        """Sum of the group costs for a board tuple."""
+        where = [0] * self.size
+        for i, tile in enumerate(board):
+            where[tile] = i
+        return sum(self._group_cost(g, [where[tile] for tile in tiles] + [where[0]])
+                   for g, tiles in enumerate(self.partition))
+
+    def delta(self, parent_h, board, tile, blank_index, swap_index):
+        """Only the moved tile's group changes, so only it is re-ranked."""
+        group = self.group_of.get(tile)
+        if group is None:
+            return parent_h
+        tiles = self.partition[group]
+        before = [board.index(t) for t in tiles]
+        after = [blank_index if t == tile else i for t, i in zip(tiles, before)]
+        return (parent_h + self._group_cost(group, after + [swap_index])
+                - self._group_cost(group, before + [blank_index]))
+
+
+_databases_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _cached_database(goal_state, width, partition):
+    return PatternDatabase(goal_state, width, partition)
+
+
+def get_pattern_database(goal_state, width=3, partition=None):
+    """Returns the shared PatternDatabase for a goal, loading it on first use."""
+    goal_state = tuple(goal_state)
+    partition = tuple(map(tuple, partition or default_partition(goal_state, width)))
+    with _databases_lock:
+        return _cached_database(goal_state, width, partition)
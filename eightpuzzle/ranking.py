@@ -0,0 +1,127 @@
+"""
+Permutation ranking (Lehmer code) for puzzle states.
+
+rank() maps a board of n cells to an integer in [0, n!) in lexicographic
+order and unrank() inverts it. These ranks are the compact key space used
+by the lookup tables and anything else that indexes states by integer.
+
+The *_many variants work on a whole batch at once. With NumPy installed
+they take and return arrays (one board per row); without it they fall
+back to plain lists. NumPy is imported on the first batched call, so
+importing this module (and the solver) doesn't pay for it.
+"""
+
+from functools import lru_cache
+from math import factorial
+
+MAX_INT64_CELLS = 20  # 20! is the largest factorial that fits in int64
+
+
+def rank(state):
+    """Lexicographic rank of a permutation of 0..n-1."""
+    n = len(state)
+    result = 0
+    for i in range(n):
+        tile = state[i]
+        smaller = 0
+        for j in range(i + 1, n):
+            if state[j] < tile:
+                smaller += 1
+        result = result * (n - i) + smaller
+    return result
+
+
+def unrank(index, n):
+    """Returns the permutation tuple of 0..n-1 with the given rank."""
+    digits = []
+    for radix in range(1, n + 1):
+        index, digit = divmod(index, radix)
+        digits.append(digit)
+    remaining = list(range(n))
+    return tuple(remaining.pop(digit) for digit in reversed(digits))
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """The numpy module, or None if it isn't installed (NumPy is optional)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def rank_many(boards):
+    """Ranks a batch of boards. Returns an int64 array (or a list without NumPy)."""
+    np = _numpy()
+    if np is None:
+        return [rank(board) for board in boards]
+
+    boards = np.asarray(boards)
+    count, n = boards.shape
+    if n > MAX_INT64_CELLS:
+        return np.array([rank(board) for board in boards.tolist()], dtype=object)
+
+    ranks = np.zeros(count, dtype=np.int64)
+    for i in range(n):
+        smaller = (boards[:, i + 1:] < boards[:, i:i + 1]).sum(axis=1)
+        ranks = ranks * (n - i) + smaller
+    return ranks
+
+
+def unrank_many(indices, n):
+    """Unranks a batch of ranks into boards, one per row."""
+    np = _numpy()
+    if np is None or n > MAX_INT64_CELLS:
+        boards = [unrank(int(index), n) for index in indices]
+        return boards if np is None else np.array(boards, dtype=np.int64)
+
+    indices = np.asarray(indices, dtype=np.int64)
+    count = len(indices)
+    boards = np.empty((count, n), dtype=np.int64)
+    available = np.ones((count, n), dtype=bool)
+    rows = np.arange(count)
+
+    for i in range(n):
+        weight = factorial(n - 1 - i)
+        digits, indices = np.divmod(indices, weight)
+        # The (digit + 1)-th still-available value goes in cell i
+        taken = np.cumsum(available, axis=1)
+        values = np.argmax(available & (taken == (digits + 1)[:, None]), axis=1)
+        boards[:, i] = values
+        available[rows, values] = False
+    return boards
+
+
+def partial_count(n, k):
+    """Number of ordered placements of k distinct items in n cells, n!/(n-k)!."""
+    return factorial(n) // factorial(n - k)
+
+
+def rank_partial(positions, n):
+    """
+    Ranks an ordered tuple of k distinct cells out of n into
+    [0, n!/(n-k)!). Used to index pattern databases by tile positions.
+    """
+    result = 0
+    for i, position in enumerate(positions):
+        smaller = 0
+        for j in range(i):
+            if positions[j] < position:
+                smaller += 1
+        result = result * (n - i) + position - smaller
+    return result
+
+
+def rank_partial_many(positions, n):
+    """Batched rank_partial; positions holds one placement per row."""
+    np = _numpy()
+    if np is None:
+        return [rank_partial(row, n) for row in positions]
+
+    positions = np.asarray(positions)
+    ranks = np.zeros(len(positions), dtype=np.int64)
+    for i in range(positions.shape[1]):
+        smaller = (positions[:, :i] < positions[:, i:i + 1]).sum(axis=1)
+        ranks = ranks * (n - i) + positions[:, i] - smaller
+    return ranks
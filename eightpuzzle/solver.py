@@ -0,0 +1,563 @@
+"""
+A* solver logic for sliding puzzles.
+
+Nothing in this module (or anywhere in the package outside gui.py) imports
+tkinter, so the solver loads quickly and works on headless machines and in
+batch worker processes.
+"""
+
+import time
+import os
+import itertools
+import collections
+
+from .bidir import bidirectional_astar
+from .heuristics import HEURISTICS, get_heuristic
+from .ida import ida_star
+from .limits import SearchLimits, CANCELLED
+from .lookup import MAX_TABLE_CELLS, solve_with_table, get_table, table_available
+from .moves import move_table, board_width, MOVE_CODES
+from .nodestore import NodeStore, NO_PARENT
+from .openlist import BucketQueue
+from .packing import pack_state, unpack_state, move_blank, get_tile, cell_bits
+
+
+class PuzzleNode:
+    """
+    A node in the A* search tree for the sliding puzzle. The packed solver
+    keeps its nodes in a NodeStore; this class backs the tuple mode.
+    """
+    __slots__ = ("state", "parent", "move", "g_cost", "blank", "h_cost", "f_cost")
+    
+    def __init__(self, state, parent=None, move=None, g_cost=0, blank=None):
+        self.state = state
+        self.parent = parent
+        self.move = move
+        self.g_cost = g_cost
+        self.blank = blank  # Blank index, tracked for packed states
+        self.h_cost = 0
+        self.f_cost = 0
+
+def calculate_heuristic(state, goal_state, width=3, heuristic="manhattan"):
+    """Scores a board (tuple or packed integer) with a registered heuristic."""
+    goal_state = tuple(goal_state)
+    if isinstance(state, int):
+        state = unpack_state(state, len(goal_state), cell_bits(len(goal_state)))
+    return get_heuristic(heuristic, goal_state, width).h(state)
+
+def calculate_manhattan_distance(state, goal_state, width=3):
+    """Calculates the Manhattan distance heuristic for a given state."""
+    return calculate_heuristic(state, goal_state, width, "manhattan")
+
+def calculate_linear_conflict_distance(state, goal_state, width=3):
+    """Manhattan distance plus 2 moves per tile that must leave its goal line."""
+    return calculate_heuristic(state, goal_state, width, "linear_conflict")
+
+METHODS = ("astar", "ida", "bidirectional", "table")
+
+def default_goal(size):
+    """Tiles in order with the blank last, e.g. 1..8,0 for 3x3."""
+    return tuple(range(1, size)) + (0,)
+
+def default_method(goal_state, width=3):
+    """
+    The lookup table for boards small enough to have one, once it has been
+    built; A* until then and for larger boards, so a first solve never
+    waits for the table's BFS. warm_up() builds the table.
+    """
+    if len(goal_state) <= MAX_TABLE_CELLS and table_available(goal_state, width):
+        return "table"
+    return "astar"
+
+def parse_board(text, size=None):
+    """
+    Parses a comma-separated board like "1,2,3,7,4,5,0,8,6" into a tuple.
+    Raises ValueError with a user-facing message if it isn't a valid board
+    (of `size` cells, when given).
+    """
+    # Clean the input string
+    parts = text.strip().replace(" ", "").split(',')
+
+    try:
+        # Try to convert all parts to integers
+        nums = [int(p) for p in parts if p]
+    except ValueError:
+        raise ValueError("Input must be numbers separated by commas.") from None
+
+    # Validation 1: Check for one number per cell
+    if size is not None and len(nums) != size:
+        raise ValueError(f"Must have exactly {size} numbers. You entered {len(nums)}.")
+
+    # Validation 2: Check for all numbers 0 to size-1
+    if sorted(nums) != list(range(len(nums))):
+        raise ValueError(f"Must include all numbers from 0 to {len(nums) - 1} exactly once.")
+
+    return tuple(nums)
+
+def check_boards(state, goal_state, width=3):
+    """
+    Raises ValueError unless goal_state holds the tiles 0..n-1 on a board
+    `width` cells wide and state is a permutation of the same tiles.
+    """
+    size = len(goal_state)
+    if sorted(goal_state) != list(range(size)):
+        raise ValueError(f"goal must include all numbers from 0 to {size - 1} exactly once")
+    if width < 1 or size % width:
+        raise ValueError(f"a board of {size} cells can't be {width} cells wide")
+    if len(state) != size or sorted(state) != list(range(size)):
+        raise ValueError("board is not a permutation of the goal's tiles")
+
+def is_solvable(state, goal_state, width=3):
+    """
+    A board can reach the goal iff the parity of the permutation between
+    them matches the parity of the blank's Manhattan distance between them.
+    """
+    goal_positions = {tile: i for i, tile in enumerate(goal_state)}
+    permutation = [goal_positions[tile] for tile in state]
+
+    # Parity of a permutation = (length - number of cycles) % 2
+    seen = [False] * len(permutation)
+    cycles = 0
+    for start in range(len(permutation)):
+        if not seen[start]:
+            cycles += 1
+            i = start
+            while not seen[i]:
+                seen[i] = True
+                i = permutation[i]
+    permutation_parity = (len(permutation) - cycles) % 2
+
+    blank_row, blank_col = divmod(state.index(0), width)
+    goal_row, goal_col = divmod(goal_positions[0], width)
+    blank_parity = (abs(blank_row - goal_row) + abs(blank_col - goal_col)) % 2
+    return permutation_parity == blank_parity
+
+def get_neighbors(node, goal_state, width=3, heuristic="manhattan"):
+    """Generates all valid successor nodes (neighbors) from the current node."""
+    scorer = get_heuristic(heuristic, tuple(goal_state), width)
+    return _neighbors(node, scorer, move_table(width, len(goal_state) // width))
+
+def _neighbors(node, scorer, moves):
+    """get_neighbors with the heuristic and move table resolved by the caller."""
+    neighbors = []
+    state_list = list(node.state)
+    blank_index = state_list.index(0)
+
+    for swap_index, move_name in moves[blank_index]:
+        new_state_list = list(state_list)
+        new_state_list[blank_index], new_state_list[swap_index] = \
+            new_state_list[swap_index], new_state_list[blank_index]
+        
+        new_state_tuple = tuple(new_state_list)
+        neighbor_node = PuzzleNode(new_state_tuple, 
+                                   parent=node, 
+                                   move=move_name, 
+                                   g_cost=node.g_cost + 1)
+        
+        # Only the slid tile changes position, so update h incrementally
+        neighbor_node.h_cost = scorer.delta(node.h_cost, state_list, state_list[swap_index],
+                                            blank_index, swap_index)
+        neighbor_node.f_cost = neighbor_node.g_cost + neighbor_node.h_cost
+        neighbors.append(neighbor_node)
+        
+    return neighbors
+
+def expand_packed(state, blank_index, h_cost, goal_state, width=3, heuristic="manhattan"):
+    """
+    Yields (new_state, swap_index, move_name, new_h_cost) for every move
+    from a packed state, without building any node objects. This looks up
+    the heuristic and move table on every call; solve_packed inlines the
+    loop with them resolved once per search.
+    """
+    scorer = get_heuristic(heuristic, tuple(goal_state), width)
+    bits = cell_bits(len(goal_state))
+    state_tuple = None
+    if scorer.needs_board:
+        # This delta reads more than the moved tile, so unpack once per expansion
+        state_tuple = unpack_state(state, len(goal_state), bits)
+
+    for swap_index, move_name in move_table(width, len(goal_state) // width)[blank_index]:
+        tile = get_tile(state, swap_index, bits)
+        new_state = move_blank(state, blank_index, swap_index, bits)
+
+        new_h_cost = scorer.delta(h_cost, state_tuple, tile, blank_index, swap_index)
+        yield new_state, swap_index, move_name, new_h_cost
+
+def get_packed_neighbors(node, goal_state, width=3, heuristic="manhattan"):
+    """Like get_neighbors, but for nodes whose state is a packed integer."""
+    neighbors = []
+    for new_state, swap_index, move_name, new_h_cost in expand_packed(
+            node.state, node.blank, node.h_cost, goal_state, width, heuristic):
+        neighbor_node = PuzzleNode(new_state,
+                                   parent=node,
+                                   move=move_name,
+                                   g_cost=node.g_cost + 1,
+                                   blank=swap_index)
+        neighbor_node.h_cost = new_h_cost
+        neighbor_node.f_cost = neighbor_node.g_cost + neighbor_node.h_cost
+        neighbors.append(neighbor_node)
+
+    return neighbors
+
+def reconstruct_path(node):
+    """Traces back from the goal node to get the solution path."""
+    path = []
+    current = node
+    while current:
+        path.append(current.state) # We only need the states for animation
+        current = current.parent
+    return path[::-1]  # Reverse the path to show from start to goal
+
+def solve_packed(initial_state, goal_state, width=3, heuristic="manhattan", limits=None):
+    """
+    A* over packed states with nodes held in a NodeStore. The open list
+    holds node indices and a single dict maps each state to the index of
+    its best node (CLOSED once expanded). Returns a solution_info dict.
+    """
+    CLOSED = -1
+    limits = limits or SearchLimits()
+    start_time = time.time()
+    size = len(goal_state)
+    bits = cell_bits(size)
+    # Resolved once: these are the same for every expansion
+    scorer = get_heuristic(heuristic, goal_state, width)
+    delta, needs_board = scorer.delta, scorer.needs_board
+    moves = move_table(width, size // width)
+    goal_key = pack_state(goal_state, bits)
+    start_key = pack_state(initial_state, bits)
+    start_h = scorer.h(initial_state)
+
+    store = NodeStore(bits * len(goal_state))
+    states, g_costs, h_costs, blanks = store.states, store.g_costs, store.h_costs, store.blanks
+    root = store.add(start_key, NO_PARENT, 0, start_h, initial_state.index(0))
+    open_set = BucketQueue()
+    open_set.push(root, start_h, 0)
+    best_nodes = {start_key: root}
+    explored = 0
+
+    while open_set:
+        index = open_set.pop()
+        state = states[index]
+        if best_nodes[state] != index:
+            continue  # Already expanded, or superseded by a cheaper node
+
+        if state == goal_key:
+            path = [unpack_state(packed, len(goal_state), bits) for packed in store.path(index)]
+            return {
+                "unsolvable": False,
+                "path": path,
+                "time": time.time() - start_time,
+                "moves": g_costs[index],
+                "explored": explored
+            }
+
+        if explored >= limits.check_at and limits.check(
+                explored, len(open_set), g_costs[index] + h_costs[index]):
+            return limits.result(start_time, explored, g_costs[index] + h_costs[index])
+
+        best_nodes[state] = CLOSED
+        explored += 1
+        new_g_cost = g_costs[index] + 1
+        blank_index, h_cost = blanks[index], h_costs[index]
+        # Only heuristics whose delta reads more than the moved tile need the board
+        board = unpack_state(state, size, bits) if needs_board else None
+
+        for swap_index, move_name in moves[blank_index]:
+            new_state = move_blank(state, blank_index, swap_index, bits)
+            known = best_nodes.get(new_state)
+            if known == CLOSED or (known is not None and new_g_cost >= g_costs[known]):
+                continue
+            new_h_cost = delta(h_cost, board, get_tile(state, swap_index, bits),
+                               blank_index, swap_index)
+
+            child = store.add(new_state, index, new_g_cost, new_h_cost, swap_index,
+                              MOVE_CODES[move_name])
+            best_nodes[new_state] = child
+            open_set.push(child, new_g_cost + new_h_cost, new_g_cost)
+
+    return None
+
+def find_solution(initial_state, goal_state, packed=True, method=None,
+                  width=None, heuristic="manhattan", cancel=None, max_nodes=None,
+                  max_time=None, progress=None):
+    """
+    Solves a sliding puzzle using A* and returns the solution_info dict
+    (None if no solution was found).
+    With packed=True the search runs on integer-packed states; the
+    reported path is always a list of state tuples.
+    method="table" skips the search and walks the precomputed lookup
+    table for goal_state instead (built on first use). The default
+    (method=None) uses the table for boards of up to MAX_TABLE_CELLS cells
+    once it exists (see default_method and warm_up), and A* otherwise.
+    method="ida" runs
+    IDA*, which needs only O(depth) memory; method="bidirectional" searches
+    from both ends at once (usually slower than A*).
+    Boards may be any size; width defaults to that of a square board.
+    Raises ValueError if the width doesn't fit the goal or initial_state
+    isn't a permutation of the goal's tiles.
+    heuristic picks the search heuristic by name (see HEURISTICS; more can
+    be added with heuristics.register_heuristic).
+    The search gives up when the `cancel` token (e.g. a threading.Event)
+    is set or after max_nodes expansions or max_time seconds, and returns
+    a partial-progress dict with a "stopped" reason instead (see
+    limits.SearchLimits.result). If `progress` is given, it is called with
+    a progress record (see limits.py) about twice a second.
+    """
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"unknown heuristic {heuristic!r}")
+    if method is not None and method not in METHODS:
+        raise ValueError(f"unknown method {method!r}")
+    initial_state, goal_state = tuple(initial_state), tuple(goal_state)
+    if width is None:
+        width = board_width(len(goal_state))
+    check_boards(initial_state, goal_state, width)
+    if method is None:
+        method = default_method(goal_state, width)
+
+    if not is_solvable(initial_state, goal_state, width):
+        return {"unsolvable": True}
+
+    if method == "table":
+        return solve_with_table(initial_state, goal_state, width)
+    limits = SearchLimits(cancel, max_nodes, max_time, progress)
+    if method == "ida":
+        return ida_star(initial_state, goal_state, width, heuristic, limits)
+    if method == "bidirectional":
+        return bidirectional_astar(initial_state, goal_state, width, heuristic, limits)
+
+    if packed:
+        return solve_packed(initial_state, goal_state, width, heuristic, limits)
+
+    start_time = time.time()
+    start_node = PuzzleNode(initial_state, g_cost=0, blank=initial_state.index(0))
+    scorer = get_heuristic(heuristic, goal_state, width)
+    moves = move_table(width, len(goal_state) // width)
+    start_node.h_cost = scorer.h(initial_state)
+    start_node.f_cost = start_node.g_cost + start_node.h_cost
+
+    open_set = BucketQueue()
+    open_set.push(start_node, start_node.f_cost, start_node.g_cost)
+    closed_set = set()
+    open_set_g_costs = {initial_state: 0}
+
+    while open_set:
+        current_node = open_set.pop()
+        
+        if current_node.state == goal_state:
+            end_time = time.time()
+            path = reconstruct_path(current_node)
+            solution_info = {
+                "unsolvable": False,
+                "path": path,
+                "time": end_time - start_time,
+                "moves": current_node.g_cost,
+                "explored": len(closed_set)
+            }
+            return solution_info
+
+        if len(closed_set) >= limits.check_at and limits.check(
+                len(closed_set), len(open_set), current_node.f_cost):
+            return limits.result(start_time, len(closed_set), current_node.f_cost)
+
+        closed_set.add(current_node.state)
+
+        for neighbor in _neighbors(current_node, scorer, moves):
+            if neighbor.state in closed_set:
+                continue
+            
+            new_g_cost = neighbor.g_cost
+            if neighbor.state in open_set_g_costs and new_g_cost >= open_set_g_costs[neighbor.state]:
+                continue
+                
+            open_set_g_costs[neighbor.state] = new_g_cost
+            open_set.push(neighbor, neighbor.f_cost, neighbor.g_cost)
+
+    return None # No solution found
+
+def solve_puzzle(initial_state, goal_state, result_queue, cache=None, store=None, **options):
+    """
+    Solves the puzzle and puts the solution_info dict in a queue.
+    This function is designed to be run in a separate thread; options
+    are passed on to find_solution.
+    While searching it also puts progress records on the queue (dicts
+    with "progress": True, see limits.py), unless progress=None is given;
+    the solution_info dict is always the last item.
+    With a cache (a cache.SolutionCache), boards on a previously found
+    path are answered from it, and new solutions are added to it; a store
+    (a store.SolutionStore) is consulted and updated the same way.
+    """
+    width = options.get("width")
+    solution_info = None
+    if cache is not None:
+        solution_info = cache.lookup(initial_state, goal_state, width)
+    if solution_info is None and store is not None:
+        solution_info = store.lookup(initial_state, goal_state, width)
+    if solution_info is None:
+        options.setdefault("progress", result_queue.put)
+        solution_info = find_solution(initial_state, goal_state, **options)
+        if store is not None:
+            store.add(solution_info, goal_state, width)
+    if cache is not None:
+        cache.store(solution_info, goal_state, width)
+    result_queue.put(solution_info)
+
+
+# --- Batch solving across processes ---
+
+_worker_goal = None
+_worker_options = {}
+
+def warm_up(goal_state, width=None, method=None, heuristic="manhattan", **options):
+    """
+    Loads the per-goal tables a solve will need, so the first board doesn't
+    pay for them. Raises ValueError if the method and heuristic can't
+    solve boards of this shape.
+    """
+    goal_state = tuple(goal_state)
+    if width is None:
+        width = board_width(len(goal_state))
+    if method == "table" or (method is None and len(goal_state) <= MAX_TABLE_CELLS):
+        get_table(goal_state, width)
+    else:
+        scorer = get_heuristic(heuristic, goal_state, width)
+        if method == "bidirectional" and not scorer.cheap_to_compile:
+            raise ValueError(f"bidirectional search does not support heuristic {heuristic!r}")
+
+def _init_worker(goal_state, options):
+    """Process pool initializer: remember the job settings and warm the tables once."""
+    global _worker_goal, _worker_options
+    _worker_goal, _worker_options = goal_state, options
+    warm_up(goal_state, **options)
+
+def _solve_chunk(states):
+    return [find_solution(state, _worker_goal, **_worker_options) for state in states]
+
+def _chunks(states, chunksize, cancel=None):
+    """
+    Yields (index of its first board, boards) for each chunk of the input,
+    stopping early once the `cancel` token is set.
+    """
+    states = iter(states)
+    start = 0
+    while cancel is None or not cancel.is_set():
+        chunk = list(itertools.islice(states, chunksize))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+def _lookup_chunks(chunks, goal_state, store, width):
+    """Adds each chunk's stored solutions (None for boards not in the store)."""
+    for start, chunk in chunks:
+        if store is None:
+            known = [None] * len(chunk)
+        else:
+            known = store.lookup_many(chunk, goal_state, width)
+        yield start, chunk, known
+
+def _merge(known, solved):
+    """Fills in the boards of a chunk that weren't stored, in order."""
+    solved = iter(solved)
+    return [solution_info if solution_info is not None else next(solved)
+            for solution_info in known]
+
+def _chunk_results(known, future):
+    """A chunk's solution_infos; boards of a chunk cancelled before it started are "cancelled"."""
+    if future is None:
+        return known
+    if future.cancelled():
+        stopped = {"unsolvable": False, "stopped": CANCELLED, "time": 0.0,
+                   "explored": 0, "bound": 0}
+        return _merge(known, itertools.repeat(stopped))
+    return _merge(known, future.result())
+
+def _solve_pooled(chunks, goal_state, workers, ordered, options):
+    """
+    Yields (start, solution_infos) per chunk from a process pool. Chunks
+    are read from the input only as the pool has room for them, so at
+    most 2 * workers are in flight and the input is never read ahead.
+    Once the cancel token is set, chunks still queued are dropped.
+    """
+    # Imported here: the process pool machinery is slow to load and only batches need it
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    in_flight = collections.deque()  # (start, known, future or None if all stored)
+
+    def collect():
+        if ordered:
+            start, known, future = in_flight.popleft()
+            yield start, _chunk_results(known, future)
+            return
+        if all(future is not None for _, _, future in in_flight):
+            wait([future for _, _, future in in_flight], return_when=FIRST_COMPLETED)
+        for entry in list(in_flight):
+            start, known, future = entry
+            if future is None or future.done():
+                in_flight.remove(entry)
+                yield start, _chunk_results(known, future)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(goal_state, options)) as executor:
+        for start, chunk, known in chunks:
+            missing = [state for state, solution_info in zip(chunk, known)
+                       if solution_info is None]
+            future = executor.submit(_solve_chunk, missing) if missing else None
+            in_flight.append((start, known, future))
+            if len(in_flight) >= 2 * workers:
+                yield from collect()
+        cancel = options.get("cancel")
+        if cancel is not None and cancel.is_set():
+            for _, _, future in in_flight:
+                if future is not None:
+                    future.cancel()  # Only succeeds for chunks no worker has started
+        while in_flight:
+            yield from collect()
+
+def solve_many(states, goal_state, workers=None, chunksize=64, ordered=True, store=None,
+               **options):
+    """
+    Solves many boards across a pool of worker processes.
+    Boards are read and sent in chunks of `chunksize` as workers free up,
+    and each worker loads the goal's tables once at startup. With
+    ordered=True solution_info dicts are yielded in input order; otherwise
+    (index, solution_info) pairs are yielded as chunks complete. Options
+    are passed on to find_solution.
+    With a store (a store.SolutionStore), each chunk is looked up in it
+    with one query and only the boards it doesn't answer are searched;
+    new solutions are added to it and flushed when the batch is done.
+    A `cancel` option stops the batch early: no more input is read,
+    running searches return "cancelled" partial results, and so do the
+    boards of chunks no worker has started. Worker processes get a copy
+    of their initializer arguments, so with workers > 1 the token must be
+    a multiprocessing.Event; anything else raises ValueError.
+    """
+    goal_state = tuple(goal_state)
+    workers = workers or os.cpu_count() or 1
+    width = options.get("width")
+    cancel = options.get("cancel")
+    if workers > 1 and cancel is not None:
+        from multiprocessing.synchronize import Event
+        if not isinstance(cancel, Event):
+            raise ValueError("with workers > 1, cancel must be a multiprocessing.Event")
+    chunks = _lookup_chunks(_chunks(states, chunksize, cancel), goal_state, store, width)
+
+    try:
+        if workers == 1:
+            warm_up(goal_state, **options)
+            for start, chunk, known in chunks:
+                for offset, (state, solution_info) in enumerate(zip(chunk, known)):
+                    if solution_info is None:
+                        solution_info = find_solution(state, goal_state, **options)
+                        if store is not None:
+                            store.add(solution_info, goal_state, width)
+                    yield solution_info if ordered else (start + offset, solution_info)
+            return
+
+        for start, results in _solve_pooled(chunks, goal_state, workers, ordered, options):
+            for offset, solution_info in enumerate(results):
+                if store is not None:
+                    store.add(solution_info, goal_state, width)  # Ignores stored ones
+                yield solution_info if ordered else (start + offset, solution_info)
+    finally:
+        if store is not None:
+            store.flush()
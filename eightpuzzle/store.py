@@ -0,0 +1,243 @@
+"""
+Persistent solution store backed by SQLite.
+
+Each row holds a packed board, its goal and width, the optimal number of
+moves and the solution as blank-move letters (e.g. "UULDR"). The packed
+board is stored as a big-endian BLOB, since 4x4 and larger boards don't
+fit SQLite's signed 64-bit integers.
+
+Writes are buffered and committed in one transaction per `batch_size`
+rows (and on flush() or close()); lookups see buffered rows too. If two
+solutions for a board are added, the shorter one is kept.
+
+Only verified rows are served. Solutions found by the solver are optimal
+and verified. Imported ones are checked move by move; on boards of up to
+MAX_TABLE_CELLS cells their length is also checked against the lookup
+table, while larger boards are stored unverified until the solver solves
+them again.
+"""
+
+import sqlite3
+import threading
+import time
+
+from .lookup import MAX_TABLE_CELLS, solve_with_table
+from .moves import board_width, moves_from_path, path_from_moves
+from .packing import pack_state, unpack_state, cell_bits
+
+DEFAULT_BATCH_SIZE = 1000
+_MAX_LOOKUP_KEYS = 500  # Boards per SELECT, under SQLite's bound-parameter limit
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    goal TEXT NOT NULL,
+    width INTEGER NOT NULL,
+    state BLOB NOT NULL,
+    moves INTEGER NOT NULL,
+    solution TEXT NOT NULL,
+    verified INTEGER NOT NULL,
+    PRIMARY KEY (goal, width, state)
+) WITHOUT ROWID
+"""
+
+_UPSERT = """
+INSERT INTO solutions (goal, width, state, moves, solution, verified)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (goal, width, state) DO UPDATE
+SET moves = excluded.moves, solution = excluded.solution, verified = excluded.verified
+WHERE excluded.moves < solutions.moves
+   OR (excluded.moves = solutions.moves AND excluded.verified > solutions.verified)
+"""
+
+
+def encode_moves(path, width=3):
+    """The blank moves along a path as one letter each, e.g. "UULDR"."""
+    return "".join(name[0] for name in moves_from_path(path, width))
+
+
+def _goal_key(goal_state):
+    return ",".join(map(str, goal_state))
+
+
+def _state_key(state):
+    size = len(state)
+    bits = cell_bits(size)
+    return pack_state(state, bits).to_bytes((bits * size + 7) // 8, "big")
+
+
+class SolutionStore:
+    """A SQLite file of solved boards, safe to share between threads."""
+
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(_SCHEMA)
+        self._pending = {}  # (goal, width, state) -> (moves, solution, verified)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        self.flush()
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def lookup(self, state, goal_state, width=None):
+        """Returns a solution_info dict for a verified stored board, else None."""
+        return self.lookup_many([state], goal_state, width)[0]
+
+    def lookup_many(self, states, goal_state, width=None):
+        """
+        Looks up a batch of boards with one query. Returns a list with a
+        solution_info dict or None for each board, in order.
+        """
+        start_time = time.time()
+        states = [tuple(state) for state in states]
+        goal = _goal_key(tuple(goal_state))
+        width = width or board_width(len(goal_state))
+        keys = [_state_key(state) for state in states]
+        entries = {}
+        with self._lock:
+            for start in range(0, len(keys), _MAX_LOOKUP_KEYS):
+                batch = keys[start:start + _MAX_LOOKUP_KEYS]
+                entries.update((state, entry) for state, *entry in self._connection.execute(
+                    "SELECT state, moves, solution, verified FROM solutions "
+                    f"WHERE goal = ? AND width = ? AND state IN ({','.join('?' * len(batch))})",
+                    [goal, width, *batch]))
+            for key in keys:
+                entry = self._pending.get((goal, width, key))
+                if entry is not None:
+                    entries[key] = entry
+
+        results = []
+        for state, key in zip(states, keys):
+            entry = entries.get(key)
+            if entry is None or not entry[2]:
+                results.append(None)
+                continue
+            moves, solution, _ = entry
+            results.append({
+                "unsolvable": False,
+                "path": path_from_moves(state, solution, width),
+                "time": time.time() - start_time,
+                "moves": moves,
+                "explored": 0,
+                "stored": True,
+            })
+        return results
+
+    def add(self, solution_info, goal_state, width=None):
+        """Buffers a solved board; other results are ignored."""
+        if (not solution_info or solution_info.get("unsolvable")
+                or solution_info.get("stored") or "path" not in solution_info):
+            return
+        goal_state = tuple(goal_state)
+        width = width or board_width(len(goal_state))
+        path = solution_info["path"]
+        self._add(path[0], goal_state, width, encode_moves(path, width), True)
+
+    def _add(self, state, goal_state, width, solution, verified):
+        key = (_goal_key(goal_state), width, _state_key(state))
+        entry = (len(solution), solution, int(verified))
+        with self._lock:
+            known = self._pending.get(key)
+            # Shorter wins; at equal length a verified row beats an unverified one
+            if known is None or (entry[0], -entry[2]) < (known[0], -known[2]):
+                self._pending[key] = entry
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered rows in one transaction."""
+        with self._lock:
+            if not self._pending:
+                return
+            rows = [key + entry for key, entry in self._pending.items()]
+            with self._connection:
+                self._connection.executemany(_UPSERT, rows)
+            self._pending.clear()
+
+    def import_records(self, records, goal_state=None, width=None):
+        """
+        Adds solutions from dicts with "board" and "solution" (move letters),
+        and optionally "goal" and "width", which default to the arguments
+        (or tiles in order with the blank last, and a square board).
+        Records without a solution are skipped. Returns how many were added.
+        Raises ValueError if a board doesn't match its goal, a move is
+        illegal, the solution doesn't reach the goal, or (for boards the
+        lookup table covers) it isn't optimal. The import is one
+        transaction, so on an error none of the records are added.
+        """
+        self.flush()
+        added = 0
+        rows = []
+        with self._lock, self._connection:
+            for number, record in enumerate(records, 1):
+                if "solution" not in record:
+                    continue
+                try:
+                    board = tuple(record["board"])
+                    goal = tuple(record.get("goal") or goal_state
+                                 or (tuple(range(1, len(board))) + (0,)))
+                    record_width = record.get("width") or width or board_width(len(goal))
+                    solution = record["solution"]
+                    verified = self._check_record(board, goal, record_width, solution)
+                except ValueError as error:
+                    raise ValueError(f"record {number}: {error}") from None
+                rows.append((_goal_key(goal), record_width, _state_key(board),
+                             len(solution), solution, int(verified)))
+                added += 1
+                if len(rows) >= self.batch_size:
+                    self._connection.executemany(_UPSERT, rows)
+                    rows.clear()
+            self._connection.executemany(_UPSERT, rows)
+        return added
+
+    def _check_record(self, board, goal_state, width, solution):
+        """Validates an imported solution; returns whether it is known optimal."""
+        if sorted(goal_state) != list(range(len(goal_state))) or len(goal_state) % width:
+            raise ValueError(f"goal is not a board of width {width}")
+        if sorted(board) != sorted(goal_state):
+            raise ValueError("board is not a permutation of the goal's tiles")
+        if path_from_moves(board, solution, width)[-1] != goal_state:
+            raise ValueError("solution does not reach the goal")
+        if len(goal_state) > MAX_TABLE_CELLS:
+            return False
+        optimal = solve_with_table(board, goal_state, width)["moves"]
+        if len(solution) != optimal:
+            raise ValueError(f"solution has {len(solution)} moves, the optimum is {optimal}")
+        return True
+
+    def export_records(self):
+        """
+        Yields every stored solution as a dict that import_records accepts,
+        with a "verified" flag (import_records re-checks rather than trusting it).
+        """
+        self.flush()
+        with self._lock:
+            cursor = self._connection.execute(
+                "SELECT goal, width, state, moves, solution, verified FROM solutions "
+                "ORDER BY goal, width, state")
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(self.batch_size)
+            if not rows:
+                return
+            for goal, width, state, moves, solution, verified in rows:
+                goal_state = [int(tile) for tile in goal.split(",")]
+                size = len(goal_state)
+                board = unpack_state(int.from_bytes(state, "big"), size, cell_bits(size))
+                yield {"board": list(board), "goal": goal_state, "width": width,
+                       "moves": moves, "solution": solution, "verified": bool(verified)}
+
+    def close(self):
+        """Writes any buffered rows and closes the database."""
+        self.flush()
+        self._connection.close()
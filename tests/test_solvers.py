@@ -0,0 +1,178 @@
+"""
+Cross-checks of the solvers, run with `python -m unittest discover tests`.
+
+Every method and heuristic must find optimal solutions, so on 3x3 boards
+they are compared with the lookup table, and on 4x4 boards (which the
+table doesn't cover) with each other. Tables are built in a temporary
+directory; the 3x3 lookup table takes a second or two.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+_table_dir = tempfile.TemporaryDirectory()
+os.environ["PUZZLE_TABLE_DIR"] = _table_dir.name  # Read when distdb is imported
+
+from eightpuzzle.heuristics import HEURISTICS, get_heuristic
+from eightpuzzle.lookup import solve_with_table
+from eightpuzzle.moves import move_table, moves_from_path, path_from_moves
+from eightpuzzle.solver import METHODS, default_goal, find_solution, is_solvable
+from eightpuzzle.store import SolutionStore, encode_moves
+
+GOAL_3X3 = default_goal(9)
+GOAL_4X4 = default_goal(16)
+
+
+def random_boards(goal_state, count, seed, width=3):
+    """`count` solvable shuffles of goal_state, the same ones for a seed."""
+    rng = random.Random(seed)
+    boards = []
+    while len(boards) < count:
+        board = list(goal_state)
+        rng.shuffle(board)
+        if is_solvable(board, goal_state, width):
+            boards.append(tuple(board))
+    return boards
+
+
+def random_walks(goal_state, count, length, seed, width=4):
+    """`count` boards `length` random blank moves (not undoing the last) from the goal."""
+    rng = random.Random(seed)
+    moves = move_table(width, len(goal_state) // width)
+    boards = []
+    for _ in range(count):
+        board = list(goal_state)
+        blank_index, previous = board.index(0), None
+        for _ in range(length):
+            swap_index = rng.choice([index for index, _ in moves[blank_index]
+                                     if index != previous])
+            board[blank_index], board[swap_index] = board[swap_index], 0
+            previous, blank_index = blank_index, swap_index
+        boards.append(tuple(board))
+    return boards
+
+
+def combinations():
+    """Every supported (method, heuristic) pair; the table ignores the heuristic."""
+    for method in METHODS:
+        for heuristic in (["manhattan"] if method == "table" else HEURISTICS):
+            if method == "bidirectional" and not get_heuristic(heuristic, GOAL_3X3).cheap_to_compile:
+                continue
+            yield method, heuristic
+
+
+class SolverTestCase(unittest.TestCase):
+
+    def assertValidPath(self, solution_info, board, goal_state, width):
+        path = solution_info["path"]
+        self.assertEqual(path[0], board)
+        self.assertEqual(path[-1], goal_state)
+        self.assertEqual(len(path) - 1, solution_info["moves"])
+        self.assertEqual(path_from_moves(board, moves_from_path(path, width), width), path)
+
+
+class TestOptimal3x3(SolverTestCase):
+    """Every method and heuristic against the lookup table."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.boards = random_boards(GOAL_3X3, 40, seed=1)
+        cls.optimal = [solve_with_table(board, GOAL_3X3, 3)["moves"] for board in cls.boards]
+
+    def test_methods_and_heuristics(self):
+        for method, heuristic in combinations():
+            for board, optimal in zip(self.boards, self.optimal):
+                with self.subTest(method=method, heuristic=heuristic, board=board):
+                    result = find_solution(board, GOAL_3X3, method=method, width=3,
+                                           heuristic=heuristic)
+                    self.assertEqual(result["moves"], optimal)
+                    self.assertValidPath(result, board, GOAL_3X3, 3)
+
+    def test_packed_matches_tuple_search(self):
+        for heuristic in HEURISTICS:
+            for board, optimal in zip(self.boards, self.optimal):
+                with self.subTest(heuristic=heuristic, board=board):
+                    packed = find_solution(board, GOAL_3X3, method="astar", heuristic=heuristic)
+                    tuples = find_solution(board, GOAL_3X3, method="astar", heuristic=heuristic,
+                                           packed=False)
+                    self.assertEqual(packed["moves"], optimal)
+                    self.assertEqual(tuples["moves"], optimal)
+                    self.assertValidPath(tuples, board, GOAL_3X3, 3)
+
+    def test_unsolvable(self):
+        board = (2, 1) + GOAL_3X3[2:]
+        for method, heuristic in combinations():
+            with self.subTest(method=method, heuristic=heuristic):
+                result = find_solution(board, GOAL_3X3, method=method, heuristic=heuristic)
+                self.assertTrue(result["unsolvable"])
+
+    def test_unsupported_combinations(self):
+        with self.assertRaises(ValueError):
+            find_solution(self.boards[0], GOAL_3X3, method="bidirectional", heuristic="pdb")
+        with self.assertRaises(ValueError):
+            find_solution(self.boards[0], GOAL_3X3, method="dfs")
+
+
+class TestAgreement4x4(SolverTestCase):
+    """The 4x4 searches must agree on the optimal length."""
+
+    def test_methods_agree(self):
+        for board in random_walks(GOAL_4X4, 6, 40, seed=2):
+            expected = find_solution(board, GOAL_4X4, method="astar",
+                                     heuristic="linear_conflict")
+            self.assertValidPath(expected, board, GOAL_4X4, 4)
+            for method in ("astar", "ida", "bidirectional"):
+                for heuristic in ("manhattan", "linear_conflict", "walking_distance"):
+                    with self.subTest(method=method, heuristic=heuristic, board=board):
+                        result = find_solution(board, GOAL_4X4, method=method,
+                                               heuristic=heuristic)
+                        self.assertEqual(result["moves"], expected["moves"])
+                        self.assertValidPath(result, board, GOAL_4X4, 4)
+
+
+class TestSolutionStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = SolutionStore(":memory:")
+        self.addCleanup(self.store.close)
+
+    def test_solved_boards_round_trip(self):
+        for board in random_boards(GOAL_3X3, 5, seed=3):
+            self.store.add(find_solution(board, GOAL_3X3), GOAL_3X3)
+        for record in self.store.export_records():
+            result = self.store.lookup(record["board"], GOAL_3X3)
+            self.assertEqual(result["moves"], record["moves"])
+            self.assertEqual(encode_moves(result["path"]), record["solution"])
+
+    def test_shorter_solution_wins(self):
+        board = random_walks(GOAL_4X4, 1, 30, seed=4)[0]
+        solved = find_solution(board, GOAL_4X4, method="astar", heuristic="linear_conflict")
+        optimal = encode_moves(solved["path"], 4)
+        detour = optimal[0] + {"U": "DU", "D": "UD", "L": "RL", "R": "LR"}[optimal[0]] + optimal[1:]
+
+        # Imported 4x4 solutions are stored unverified, so they aren't served
+        self.assertEqual(self.store.import_records([{"board": board, "solution": detour}]), 1)
+        self.assertIsNone(self.store.lookup(board, GOAL_4X4))
+
+        self.store.add(solved, GOAL_4X4)
+        self.assertEqual(self.store.lookup(board, GOAL_4X4)["moves"], solved["moves"])
+        self.store.import_records([{"board": board, "solution": detour}])
+        self.assertEqual([record["solution"] for record in self.store.export_records()],
+                         [optimal])
+
+    def test_import_is_all_or_nothing(self):
+        board = random_boards(GOAL_3X3, 1, seed=5)[0]
+        solution = encode_moves(solve_with_table(board, GOAL_3X3, 3)["path"])
+        records = [{"board": board, "solution": solution},
+                   {"board": board, "solution": solution + "UD"}]  # Not optimal
+        with self.assertRaises(ValueError):
+            self.store.import_records(records)
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(self.store.import_records(records[:1]), 1)
+        self.assertEqual(self.store.lookup(board, GOAL_3X3)["moves"], len(solution))
+
+
+if __name__ == "__main__":
+    unittest.main()